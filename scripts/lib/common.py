@@ -8,6 +8,7 @@ import os
 import sys
 import json
 import subprocess
+import time
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Any
@@ -122,9 +123,18 @@ class Logger:
         self.log_file = log_file
         if log_file:
             log_file.parent.mkdir(parents=True, exist_ok=True)
+        # (second, formatted) - timestamp is re-formatted once per second
+        self._ts: tuple = (-1, "")
+
+    def _timestamp(self) -> str:
+        now = time.time()
+        sec = int(now)
+        if sec != self._ts[0]:
+            self._ts = (sec, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now)))
+        return self._ts[1]
 
     def _log(self, level: str, message: str):
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = self._timestamp()
         log_line = f"[{timestamp}] {level}: {message}"
 
         print(log_line)
@@ -4,20 +4,29 @@ Handles game path detection, API communication, and mod downloads.
 Integrates with ficsit-cli for reliable mod installation.
 """
 
+import hashlib
 import json
 import logging
 import os
 import platform
 import shutil
+import socket
 import subprocess
 import tempfile
+import threading
 import time
 import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import AbstractSet, Callable, Dict, Iterable, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -25,9 +34,136 @@ logger = logging.getLogger(__name__)
 
 # API Configuration
 FICSIT_API_URL = "https://api.ficsit.app/v2/query"
+FICSIT_DOWNLOAD_HOST = "https://api.ficsit.app"
 FICSIT_CLI_RELEASES_URL = "https://api.github.com/repos/satisfactorymodding/ficsit-cli/releases/latest"
 REQUEST_TIMEOUT = 60
 DOWNLOAD_TIMEOUT = 300
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # Bytes read per write when streaming downloads to disk
+VERSION_FETCH_WORKERS = 8  # Concurrent ficsit.app requests when loading versions
+# Mod archives downloaded at once by installs and updates
+DOWNLOAD_WORKERS = min(8, (os.cpu_count() or 2) * 2)
+# Mod folders checked at once during a scan (the work is stat/open bound)
+SCAN_WORKERS = min(16, (os.cpu_count() or 4) * 4)
+# Socket receive buffer requested for download connections; the OS may clamp it
+DOWNLOAD_RCVBUF = 4 * 1024 * 1024
+
+# Mod metadata (version, download URL, dependencies) shared by every
+# FicsitAPIClient in the process, so data prefetched while the user picks
+# mods is reused by dependency resolution. Persisted to the app data dir so
+# a relaunch within the TTL resolves without any API calls.
+MOD_METADATA_TTL_SECONDS = 600
+MOD_METADATA_CACHE_FILE = "mod_metadata_cache.json"
+_mod_metadata_cache: Dict[str, Tuple[float, Tuple]] = {}
+_mod_metadata_lock = threading.Lock()
+_mod_metadata_loaded = False
+_mod_metadata_dirty = False  # Entries added since the last save
+_mod_metadata_save_lock = threading.Lock()
+
+# Resolved dependency lists keyed by the selected refs, so retrying an install
+# with the same selection skips the walk and sort. Expires with the metadata.
+_resolution_cache: Dict[frozenset, Tuple[float, List["ResolvedMod"], Dict[str, str]]] = {}
+_resolution_lock = threading.Lock()
+
+# Download pool shared by installs and updates, created on first use
+_download_pool: Optional[ThreadPoolExecutor] = None
+_download_pool_lock = threading.Lock()
+
+
+def get_download_pool() -> ThreadPoolExecutor:
+    """Return the process-wide pool used for concurrent mod downloads."""
+    global _download_pool
+    with _download_pool_lock:
+        if _download_pool is None:
+            _download_pool = ThreadPoolExecutor(
+                max_workers=DOWNLOAD_WORKERS,
+                thread_name_prefix="mod-download"
+            )
+        return _download_pool
+
+
+# One keep-alive HTTP session for every FicsitAPIClient, created on first use
+_api_session: Optional[requests.Session] = None
+_api_session_lock = threading.Lock()
+
+
+def _get_api_session() -> requests.Session:
+    """Return the shared ficsit.app session, pooled for concurrent fetches."""
+    global _api_session
+    with _api_session_lock:
+        if _api_session is None:
+            session = requests.Session()
+            session.headers.update({
+                "Content-Type": "application/json",
+                "User-Agent": "SatisfactoryModInstaller/1.0"
+            })
+            # Room for the version fetch workers plus the metadata prefetch
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=VERSION_FETCH_WORKERS * 2)
+            session.mount("https://", adapter)
+            _api_session = session
+        return _api_session
+
+
+def get_app_data_dir() -> Path:
+    """Per-user directory for installer caches and settings (not created here)."""
+    if platform.system() == "Windows":
+        return Path(os.environ.get("LOCALAPPDATA", Path.home())) / "SatisfactoryModInstaller"
+    return Path.home() / ".satisfactory-mod-installer"
+
+
+def _load_mod_metadata_cache():
+    """Read unexpired metadata from disk once. Caller holds _mod_metadata_lock."""
+    global _mod_metadata_loaded
+    if _mod_metadata_loaded:
+        return
+    _mod_metadata_loaded = True
+    try:
+        with open(get_app_data_dir() / MOD_METADATA_CACHE_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return
+    if not isinstance(data, dict):
+        return
+    now = time.time()
+    for ref, entry in data.items():
+        # Skip entries that don't have the expected shape (truncated,
+        # hand-edited or written by an older version)
+        try:
+            cached_at, (version, download_url, dependencies, warning) = entry
+            fresh = now - cached_at < MOD_METADATA_TTL_SECONDS
+            dependencies = list(dependencies)
+        except (TypeError, ValueError):
+            continue
+        if fresh and ref not in _mod_metadata_cache:
+            _mod_metadata_cache[ref] = (cached_at, (version, download_url, dependencies, warning))
+
+
+def save_mod_metadata_cache():
+    """Write the unexpired part of the shared metadata cache to disk, if it changed."""
+    global _mod_metadata_dirty
+    # Saves are serialized (the prefetch thread and resolve_all may both
+    # save) and written to a temp file that replaces the cache in one step,
+    # so readers never see a torn file
+    with _mod_metadata_save_lock:
+        now = time.time()
+        with _mod_metadata_lock:
+            if not _mod_metadata_dirty:
+                return
+            _mod_metadata_dirty = False
+            snapshot = {
+                ref: [cached_at, list(result)]
+                for ref, (cached_at, result) in _mod_metadata_cache.items()
+                if now - cached_at < MOD_METADATA_TTL_SECONDS
+            }
+        try:
+            cache_dir = get_app_data_dir()
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_file = cache_dir / MOD_METADATA_CACHE_FILE
+            tmp_file = cache_file.with_name(cache_file.name + ".tmp")
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.warning(f"Failed to save mod metadata cache: {e}")
 
 
 @dataclass
@@ -182,7 +318,7 @@ class FicsitCLI:
 
             cli_path = self.cache_dir / cli_name
             with open(cli_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                     if chunk:
                         f.write(chunk)
                         downloaded += len(chunk)
@@ -443,6 +579,31 @@ class GamePathDetector:
         r"F:\Epic Games\Satisfactory",
     ]
 
+    # Filesystem probes run concurrently so slow drives overlap
+    DETECT_WORKERS = 4
+
+    # Last known game path, remembered across launches
+    CACHE_FILE_NAME = "game_path.txt"
+
+    @classmethod
+    def load_cached(cls) -> Optional[str]:
+        """Return the remembered game path if it is still a valid install."""
+        try:
+            path = (get_app_data_dir() / cls.CACHE_FILE_NAME).read_text(encoding="utf-8").strip()
+        except OSError:
+            return None
+        return path if cls._is_valid_game_path(path) else None
+
+    @classmethod
+    def remember(cls, path: str):
+        """Store path so the next launch can skip detection."""
+        try:
+            cache_dir = get_app_data_dir()
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            (cache_dir / cls.CACHE_FILE_NAME).write_text(path, encoding="utf-8")
+        except OSError as e:
+            logger.warning(f"Failed to remember game path: {e}")
+
     @classmethod
     def detect(cls) -> Optional[str]:
         """Detect Satisfactory installation path."""
@@ -450,27 +611,30 @@ class GamePathDetector:
             logger.warning("Game path detection only supported on Windows")
             return None
 
-        # Try registry first
-        path = cls._check_registry()
-        if path:
-            return path
-
-        # Try common Steam paths
-        for steam_path in cls.COMMON_STEAM_PATHS:
-            if cls._is_valid_game_path(steam_path):
-                return steam_path
+        # Probes in order of preference: registry, common Steam paths,
+        # common Epic paths, then Steam library folders
+        probes: List[Callable[[], Optional[str]]] = [cls._check_registry]
+        probes += [partial(cls._probe_path, p) for p in cls.COMMON_STEAM_PATHS]
+        probes += [partial(cls._probe_path, p) for p in cls.COMMON_EPIC_PATHS]
+        probes.append(cls._check_steam_libraries)
 
-        # Try common Epic paths
-        for epic_path in cls.COMMON_EPIC_PATHS:
-            if cls._is_valid_game_path(epic_path):
-                return epic_path
-
-        # Try Steam library folders
-        path = cls._check_steam_libraries()
-        if path:
-            return path
+        pool = ThreadPoolExecutor(max_workers=cls.DETECT_WORKERS)
+        try:
+            futures = [pool.submit(probe) for probe in probes]
+            # Walk results in preference order so the chosen path is the
+            # same as a serial search would pick
+            for future in futures:
+                path = future.result()
+                if path:
+                    return path
+            return None
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
 
-        return None
+    @classmethod
+    def _probe_path(cls, path: str) -> Optional[str]:
+        """Return path if it is a valid game installation, else None."""
+        return path if cls._is_valid_game_path(path) else None
 
     @classmethod
     def _check_registry(cls) -> Optional[str]:
@@ -532,11 +696,8 @@ class FicsitAPIClient:
     """Client for ficsit.app GraphQL API."""
 
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            "Content-Type": "application/json",
-            "User-Agent": "SatisfactoryModInstaller/1.0"
-        })
+        # Shared across clients so the TLS connection is reused process-wide
+        self.session = _get_api_session()
 
     def get_mod_info(self, mod_reference: str) -> Tuple[Optional[str], Optional[str]]:
         """
@@ -615,11 +776,56 @@ class FicsitAPIClient:
     def get_mod_with_dependencies(self, mod_reference: str) -> Tuple[Optional[str], Optional[str], List[str], Optional[str]]:
         """
         Get mod info including its dependencies and compatibility status.
+        Served from the shared metadata cache when a fresh entry exists.
 
         Returns:
             Tuple of (version, download_url, list of dependency mod_references, compatibility_warning)
             compatibility_warning is None if mod is compatible, otherwise a warning message
         """
+        global _mod_metadata_dirty
+        with _mod_metadata_lock:
+            _load_mod_metadata_cache()
+            entry = _mod_metadata_cache.get(mod_reference)
+        if entry and (time.time() - entry[0]) < MOD_METADATA_TTL_SECONDS:
+            version, download_url, dependencies, warning = entry[1]
+            return version, download_url, list(dependencies), warning
+
+        result = self._fetch_mod_with_dependencies(mod_reference)
+        if result[0] is not None:
+            with _mod_metadata_lock:
+                _mod_metadata_cache[mod_reference] = (time.time(), result)
+                _mod_metadata_dirty = True
+        return result
+
+    def missing_mod_metadata(self, mod_references: Iterable[str]) -> List[str]:
+        """Return the references with no fresh entry in the shared metadata cache."""
+        now = time.time()
+        with _mod_metadata_lock:
+            _load_mod_metadata_cache()
+            return [
+                ref for ref in mod_references
+                if ref not in _mod_metadata_cache
+                or now - _mod_metadata_cache[ref][0] >= MOD_METADATA_TTL_SECONDS
+            ]
+
+    def prefetch_mod_metadata(self, mod_references: List[str]):
+        """
+        Warm the shared metadata cache for the given mods and their dependencies.
+        Meant to run in a background thread while the user is idle.
+        """
+        seen = set()
+        to_fetch = list(mod_references)
+        while to_fetch:
+            ref = to_fetch.pop()
+            if ref in seen:
+                continue
+            seen.add(ref)
+            _, _, dependencies, _ = self.get_mod_with_dependencies(ref)
+            to_fetch.extend(d for d in dependencies if d not in seen)
+        save_mod_metadata_cache()
+
+    def _fetch_mod_with_dependencies(self, mod_reference: str) -> Tuple[Optional[str], Optional[str], List[str], Optional[str]]:
+        """Query ficsit.app for a mod's latest version, dependencies and compatibility."""
         query = """
         query GetModWithDeps($modReference: ModReference!) {
             getModByReference(modReference: $modReference) {
@@ -809,6 +1015,8 @@ class VersionCache:
     """
     Cache for mod version information.
     Stores fetched versions locally to avoid repeated API calls.
+    Only versions with a Windows build are kept, since those are the
+    only ones the installer can use.
     """
 
     CACHE_TTL_SECONDS = 3600  # 1 hour
@@ -820,17 +1028,13 @@ class VersionCache:
         Args:
             cache_dir: Directory for cache storage. Defaults to user's app data.
         """
-        if cache_dir:
-            self.cache_dir = Path(cache_dir)
-        else:
-            if platform.system() == "Windows":
-                self.cache_dir = Path(os.environ.get("LOCALAPPDATA", Path.home())) / "SatisfactoryModInstaller"
-            else:
-                self.cache_dir = Path.home() / ".satisfactory-mod-installer"
+        self.cache_dir = Path(cache_dir) if cache_dir else get_app_data_dir()
 
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.cache_file = self.cache_dir / "version_cache.json"
         self._cache: Dict = {}
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
         self._load_cache()
 
     def _load_cache(self):
@@ -848,8 +1052,11 @@ class VersionCache:
     def _save_cache(self):
         """Save cache to disk."""
         try:
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self._cache, f, indent=2)
+            with self._save_lock:
+                with self._lock:
+                    snapshot = dict(self._cache)
+                with open(self.cache_file, 'w', encoding='utf-8') as f:
+                    json.dump(snapshot, f, indent=2)
         except IOError as e:
             logger.warning(f"Failed to save version cache: {e}")
 
@@ -865,29 +1072,44 @@ class VersionCache:
         Returns:
             List of ModVersion objects or None if not cached/expired
         """
-        entry = self._cache.get(mod_reference)
+        with self._lock:
+            entry = self._cache.get(mod_reference)
         if entry is None or self._is_expired(entry):
             return None
 
+        # Entries written before filtering moved here may still hold
+        # non-Windows versions; skip those until they expire
         versions = []
         for v_data in entry.get("versions", []):
+            if not v_data.get("has_windows_target", False):
+                continue
             versions.append(ModVersion(
                 version=v_data["version"],
                 download_url=v_data.get("download_url"),
                 created_at=v_data.get("created_at", ""),
-                has_windows_target=v_data.get("has_windows_target", False)
+                has_windows_target=True
             ))
         return versions
 
-    def set_versions(self, mod_reference: str, versions: List[ModVersion]):
+    def set_versions(
+        self,
+        mod_reference: str,
+        versions: List[ModVersion],
+        save: bool = True
+    ) -> List[ModVersion]:
         """
-        Cache versions for a mod.
+        Cache the Windows-targeted versions of a mod.
 
         Args:
             mod_reference: The mod's reference ID
             versions: List of ModVersion objects to cache
+            save: Write the cache to disk immediately
+
+        Returns:
+            The versions that were kept
         """
-        self._cache[mod_reference] = {
+        versions = [v for v in versions if v.has_windows_target]
+        entry = {
             "cached_at": time.time(),
             "versions": [
                 {
@@ -899,7 +1121,11 @@ class VersionCache:
                 for v in versions
             ]
         }
-        self._save_cache()
+        with self._lock:
+            self._cache[mod_reference] = entry
+        if save:
+            self._save_cache()
+        return versions
 
     def get_or_fetch(
         self,
@@ -926,19 +1152,72 @@ class VersionCache:
         logger.debug(f"Cache miss for {mod_reference}, fetching from API")
         versions = api_client.get_mod_versions(mod_reference, limit)
         if versions:
-            self.set_versions(mod_reference, versions)
+            versions = self.set_versions(mod_reference, versions)
         return versions
 
+    def get_or_fetch_many(
+        self,
+        mod_references: List[str],
+        api_client: FicsitAPIClient,
+        limit: int = 20,
+        on_result: Optional[Callable[[str, List[ModVersion]], None]] = None
+    ) -> Dict[str, List[ModVersion]]:
+        """
+        Like get_or_fetch for several mods, fetching cache misses concurrently.
+
+        Args:
+            mod_references: Mod reference IDs to look up
+            api_client: API client to use for fetching
+            limit: Max versions to fetch if not cached
+            on_result: Optional callback(mod_ref, versions), called from
+                worker threads as each mod completes
+
+        Returns:
+            Dict mapping mod_ref to its list of ModVersion objects
+        """
+        results: Dict[str, List[ModVersion]] = {}
+        misses = []
+        for ref in mod_references:
+            cached = self.get_versions(ref)
+            if cached is None:
+                misses.append(ref)
+                continue
+            results[ref] = cached
+            if on_result:
+                on_result(ref, cached)
+
+        if not misses:
+            return results
+
+        logger.debug(f"Fetching versions for {len(misses)} mods from API")
+
+        def fetch(ref: str):
+            versions = api_client.get_mod_versions(ref, limit)
+            if versions:
+                versions = self.set_versions(ref, versions, save=False)
+            if on_result:
+                on_result(ref, versions)
+            return ref, versions
+
+        with ThreadPoolExecutor(max_workers=min(VERSION_FETCH_WORKERS, len(misses))) as pool:
+            for ref, versions in pool.map(fetch, misses):
+                results[ref] = versions
+
+        self._save_cache()
+        return results
+
     def clear(self):
         """Clear all cached data."""
-        self._cache = {}
+        with self._lock:
+            self._cache = {}
         if self.cache_file.exists():
             self.cache_file.unlink()
 
     def invalidate(self, mod_reference: str):
         """Invalidate cache for a specific mod."""
-        if mod_reference in self._cache:
-            del self._cache[mod_reference]
+        with self._lock:
+            removed = self._cache.pop(mod_reference, None) is not None
+        if removed:
             self._save_cache()
 
 
@@ -965,6 +1244,9 @@ class UpdateChecker:
         self.mods_dir = Path(mods_dir)
         self.api_client = api_client or FicsitAPIClient()
         self.version_cache = version_cache or VersionCache()
+        # .uplugin path -> (mtime_ns, size, parsed version); re-parsed only
+        # when the file changes
+        self._installed_versions: Dict[str, Tuple[int, int, Optional[str]]] = {}
 
     def _compare_versions(self, installed: str, latest: str) -> bool:
         """
@@ -1000,12 +1282,23 @@ class UpdateChecker:
         if not uplugin_files:
             return None
 
+        uplugin = str(uplugin_files[0])
         try:
-            with open(uplugin_files[0], 'r', encoding='utf-8') as f:
+            st = os.stat(uplugin)
+        except OSError:
+            return None
+        cached = self._installed_versions.get(uplugin)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        try:
+            with open(uplugin, 'r', encoding='utf-8') as f:
                 uplugin_data = json.load(f)
-                return uplugin_data.get("VersionName") or str(uplugin_data.get("Version", ""))
+                version = uplugin_data.get("VersionName") or str(uplugin_data.get("Version", ""))
         except (json.JSONDecodeError, IOError):
             return None
+        self._installed_versions[uplugin] = (st.st_mtime_ns, st.st_size, version)
+        return version
 
     def check_for_updates(
         self,
@@ -1027,6 +1320,9 @@ class UpdateChecker:
         results = []
         mod_names = mod_names or {}
 
+        # Fetch uncached versions for every mod up front, concurrently
+        all_versions = self.version_cache.get_or_fetch_many(mod_refs, self.api_client)
+
         for i, mod_ref in enumerate(mod_refs):
             if progress_callback:
                 progress_callback(mod_ref, f"Checking {mod_ref} ({i+1}/{len(mod_refs)})...")
@@ -1034,15 +1330,14 @@ class UpdateChecker:
             # Get installed version
             installed_version = self._get_installed_version(mod_ref)
 
-            # Get available versions from cache or API
-            versions = self.version_cache.get_or_fetch(mod_ref, self.api_client)
+            versions = all_versions.get(mod_ref)
 
             if not versions:
                 logger.warning(f"No versions found for {mod_ref}")
                 continue
 
             latest_version = versions[0].version
-            available_version_strings = [v.version for v in versions if v.has_windows_target]
+            available_version_strings = [v.version for v in versions]
 
             # Determine if update is needed
             needs_update = False
@@ -1136,15 +1431,25 @@ class DependencyResolver:
         Returns:
             Tuple of (list of all resolved mods including dependencies, dict of errors)
         """
+        key = frozenset(mod_references)
+        with _resolution_lock:
+            cached = _resolution_cache.get(key)
+        if cached and time.time() - cached[0] < MOD_METADATA_TTL_SECONDS:
+            _, resolved_list, errors = cached
+            self._cache = {m.mod_reference: m for m in resolved_list}
+            self._resolution_errors = dict(errors)
+            return list(resolved_list), dict(errors)
+
         self._cache.clear()
         self._resolution_errors.clear()
 
         # Always include SML as it's required for all mods
         all_needed = set(["SML"])
-        to_process = list(mod_references)
+        to_process = deque(mod_references)
+        queued = set(mod_references)
 
         while to_process:
-            mod_ref = to_process.pop(0)
+            mod_ref = to_process.popleft()
 
             if mod_ref in self._cache:
                 continue
@@ -1181,43 +1486,67 @@ class DependencyResolver:
 
             # Queue dependencies for resolution
             for dep in dependencies:
-                if dep not in self._cache and dep not in to_process:
+                if dep not in self._cache and dep not in queued:
                     to_process.append(dep)
+                    queued.add(dep)
                     all_needed.add(dep)
 
+        save_mod_metadata_cache()
+
         # Build ordered list (dependencies first)
         ordered = self._topological_sort(list(all_needed))
+        resolved_list = [self._cache[ref] for ref in ordered if ref in self._cache]
+
+        # Only cache complete resolutions. A lookup failure (network error or
+        # unknown mod) must be retried next time; BROKEN warnings belong to
+        # mods that did resolve and are safe to keep.
+        failed = any(ref not in self._cache for ref in self._resolution_errors)
+        with _resolution_lock:
+            if failed:
+                _resolution_cache.pop(key, None)
+            else:
+                _resolution_cache[key] = (time.time(), resolved_list, dict(self._resolution_errors))
 
-        return [self._cache[ref] for ref in ordered if ref in self._cache], self._resolution_errors
+        return list(resolved_list), self._resolution_errors
 
     def _topological_sort(self, mod_refs: List[str]) -> List[str]:
         """
-        Sort mods so dependencies come before dependents.
-        SML always comes first.
-        """
-        # Simple approach: dependencies first based on depth
-        result = []
-        visited = set()
-
-        def visit(ref: str, depth: int = 0):
-            if ref in visited or depth > 50:  # Prevent infinite loops
-                return
-            visited.add(ref)
-
-            if ref in self._cache:
-                for dep in self._cache[ref].dependencies:
-                    visit(dep, depth + 1)
-
-            if ref not in result:
-                result.append(ref)
-
-        # SML first
-        if "SML" in mod_refs:
-            visit("SML")
+        Sort mods so dependencies come before dependents (Kahn's algorithm).
+        SML always comes first. Mods caught in a dependency cycle are
+        appended at the end in their original order.
+        """
+        nodes = list(dict.fromkeys(mod_refs))
+        if "SML" in nodes:
+            nodes.remove("SML")
+            nodes.insert(0, "SML")
+        node_set = set(nodes)
+
+        in_degree: Dict[str, int] = {ref: 0 for ref in nodes}
+        dependents: Dict[str, List[str]] = {ref: [] for ref in nodes}
+        for ref in nodes:
+            resolved = self._cache.get(ref)
+            if resolved is None:
+                continue
+            for dep in set(resolved.dependencies):
+                if dep in node_set and dep != ref:
+                    dependents[dep].append(ref)
+                    in_degree[ref] += 1
 
-        # Then all others
-        for ref in mod_refs:
-            visit(ref)
+        ready = deque(ref for ref in nodes if in_degree[ref] == 0)
+        result = []
+        while ready:
+            ref = ready.popleft()
+            result.append(ref)
+            for dependent in dependents[ref]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(result) < len(nodes):
+            placed = set(result)
+            cyclic = [ref for ref in nodes if ref not in placed]
+            logger.warning(f"Dependency cycle between: {cyclic}")
+            result.extend(cyclic)
 
         return result
 
@@ -1238,27 +1567,41 @@ class ModScanner:
 
     def __init__(self, mods_dir: Path):
         self.mods_dir = Path(mods_dir)
+        self._scan_cache: Optional[Dict[str, ModStatus]] = None
+
+    def invalidate(self):
+        """Forget the last scan. Call after installing or removing mods."""
+        self._scan_cache = None
 
     def scan_installed(self) -> Dict[str, ModStatus]:
         """
         Scan the mods directory and return status of each installed mod.
+        The result is reused until invalidate() is called; treat it as read-only.
 
         Returns:
             Dict mapping mod_reference to ModStatus
         """
+        if self._scan_cache is None:
+            self._scan_cache = self._scan()
+        return self._scan_cache
+
+    def _scan(self) -> Dict[str, ModStatus]:
+        """Walk the mods directory and check every mod folder."""
         results: Dict[str, ModStatus] = {}
 
         if not self.mods_dir.exists():
             logger.warning(f"Mods directory does not exist: {self.mods_dir}")
             return results
 
-        for item in self.mods_dir.iterdir():
-            if not item.is_dir():
-                continue
+        mod_dirs = [item for item in self.mods_dir.iterdir() if item.is_dir()]
+        if not mod_dirs:
+            return results
 
-            mod_ref = item.name
-            status = self._check_mod_directory(item, mod_ref)
-            results[mod_ref] = status
+        # Folders are independent, so overlap their filesystem calls
+        with ThreadPoolExecutor(max_workers=min(SCAN_WORKERS, len(mod_dirs))) as pool:
+            statuses = pool.map(lambda d: self._check_mod_directory(d, d.name), mod_dirs)
+            for item, status in zip(mod_dirs, statuses):
+                results[item.name] = status
 
         return results
 
@@ -1268,17 +1611,18 @@ class ModScanner:
         uplugin_files = list(mod_dir.glob("*.uplugin"))
         has_uplugin = len(uplugin_files) > 0
 
-        # Count pak files (in Content/Paks subdirectories)
-        pak_files = list(mod_dir.rglob("*.pak"))
-        pak_count = len(pak_files)
-
-        # Count dll files (Windows binaries)
-        dll_files = list(mod_dir.rglob("*.dll"))
-        dll_count = len(dll_files)
-
-        # Count .so files (Linux binaries)
-        so_files = list(mod_dir.rglob("*.so"))
-        so_count = len(so_files)
+        # Count pak files (in Content/Paks subdirectories), dll files (Windows
+        # binaries) and .so files (Linux binaries) in a single walk
+        pak_count = dll_count = so_count = 0
+        for _, _, files in os.walk(mod_dir):
+            for name in files:
+                ext = os.path.splitext(name)[1].lower()
+                if ext == ".pak":
+                    pak_count += 1
+                elif ext == ".dll":
+                    dll_count += 1
+                elif ext == ".so":
+                    so_count += 1
 
         # Try to read version from uplugin
         version = None
@@ -1350,6 +1694,16 @@ class ModScanner:
         return missing
 
 
+class _DownloadAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections ask for a large receive buffer."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_RCVBUF, DOWNLOAD_RCVBUF)
+        ]
+        super().init_poolmanager(*args, **kwargs)
+
+
 class ModDownloader:
     """Downloads and extracts mods from ficsit.app."""
 
@@ -1360,12 +1714,29 @@ class ModDownloader:
         self.session.headers.update({
             "User-Agent": "SatisfactoryModInstaller/1.0"
         })
+        # Keep a connection per download worker and retry dropped connections
+        adapter = _DownloadAdapter(
+            pool_connections=4,
+            pool_maxsize=DOWNLOAD_WORKERS,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        self.session.mount("https://", adapter)
+        # Downloads may run concurrently; extraction into Mods is serialized
+        self._install_lock = threading.Lock()
+
+    def warm_up(self):
+        """Open a keep-alive connection to the download host ahead of time."""
+        try:
+            self.session.head(FICSIT_DOWNLOAD_HOST, timeout=5)
+        except requests.RequestException as e:
+            logger.debug(f"Connection warm-up failed: {e}")
 
     def download_and_install(
         self,
         mod_reference: str,
         download_url: str,
-        progress_callback: Optional[Callable[[int, int], None]] = None
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        cancel_event: Optional[threading.Event] = None
     ) -> InstallResult:
         """
         Download and install a mod.
@@ -1374,6 +1745,8 @@ class ModDownloader:
             mod_reference: The mod's reference ID
             download_url: URL to download .smod file
             progress_callback: Optional callback(downloaded_bytes, total_bytes)
+            cancel_event: Optional event; once set, the download stops at the
+                next chunk and nothing is installed
 
         Returns:
             InstallResult with success status and details
@@ -1397,7 +1770,14 @@ class ModDownloader:
             downloaded = 0
 
             with open(smod_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    if cancel_event is not None and cancel_event.is_set():
+                        response.close()
+                        return InstallResult(
+                            mod_reference=mod_reference,
+                            success=False,
+                            message="Cancelled"
+                        )
                     if chunk:
                         f.write(chunk)
                         downloaded += len(chunk)
@@ -1414,7 +1794,8 @@ class ModDownloader:
 
             # Extract and install
             logger.info(f"Extracting {mod_reference}...")
-            files_installed = self._extract_and_install(smod_path, mod_reference)
+            with self._install_lock:
+                files_installed = self._extract_and_install(smod_path, mod_reference)
 
             if files_installed > 0:
                 return InstallResult(
@@ -1551,6 +1932,9 @@ class ModManager:
             self.config_path = Path(__file__).parent.parent / "config" / "mods-list.json"
 
         self.mods: List[Mod] = []
+        self._by_category: Optional[Dict[str, List[Mod]]] = None
+        self._mod_refs: Optional[List[str]] = None
+        self._mod_name_map: Optional[Dict[str, str]] = None
         self._load_config()
 
     def _load_config(self):
@@ -1563,31 +1947,68 @@ class ModManager:
             with open(self.config_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
 
-            for mod_data in data.get("mods", []):
-                mod = Mod(
-                    name=mod_data["name"],
-                    mod_reference=mod_data["mod_reference"],
-                    category=mod_data.get("category", "other"),
-                    required=mod_data.get("required", False),
-                    priority=mod_data.get("priority", 99),
-                    description=mod_data.get("description", "")
-                )
-                self.mods.append(mod)
+            self.mods.extend(self._mods_from_config(data.get("mods", [])))
 
             # Sort by priority
             self.mods.sort(key=lambda m: m.priority)
+            self.invalidate_cache()
 
         except (json.JSONDecodeError, KeyError) as e:
             logger.error(f"Failed to load config: {e}")
 
+    @staticmethod
+    def _mods_from_config(entries: List[Dict]) -> List[Mod]:
+        """Build Mod objects from mods-list.json style entries."""
+        return [
+            Mod(
+                name=mod_data["name"],
+                mod_reference=mod_data["mod_reference"],
+                category=mod_data.get("category", "other"),
+                required=mod_data.get("required", False),
+                priority=mod_data.get("priority", 99),
+                description=mod_data.get("description", "")
+            )
+            for mod_data in entries
+        ]
+
+    def load_embedded_config(self):
+        """Append the built-in mod list (used when mods-list.json is missing)."""
+        self.mods.extend(self._mods_from_config(get_embedded_mods_config()))
+        self.invalidate_cache()
+
+    def invalidate_cache(self):
+        """Drop derived mod lookups. Call after mutating self.mods."""
+        self._by_category = None
+        self._mod_refs = None
+        self._mod_name_map = None
+
+    @property
+    def mod_refs(self) -> List[str]:
+        """Mod references in config order (cached; treat as read-only)."""
+        if self._mod_refs is None:
+            self._mod_refs = [mod.mod_reference for mod in self.mods]
+        return self._mod_refs
+
+    @property
+    def mod_name_map(self) -> Dict[str, str]:
+        """Mapping of mod reference to display name (cached; treat as read-only)."""
+        if self._mod_name_map is None:
+            self._mod_name_map = {mod.mod_reference: mod.name for mod in self.mods}
+        return self._mod_name_map
+
     def get_mods_by_category(self) -> Dict[str, List[Mod]]:
-        """Get mods organized by category."""
-        categories: Dict[str, List[Mod]] = {}
-        for mod in self.mods:
-            if mod.category not in categories:
-                categories[mod.category] = []
-            categories[mod.category].append(mod)
-        return categories
+        """
+        Get mods organized by category.
+
+        The result is built on first access and reused until
+        invalidate_cache() is called; treat it as read-only.
+        """
+        if self._by_category is None:
+            categories: Dict[str, List[Mod]] = {}
+            for mod in self.mods:
+                categories.setdefault(mod.category, []).append(mod)
+            self._by_category = categories
+        return self._by_category
 
     def fetch_mod_info(self, mod: Mod) -> bool:
         """
@@ -1636,6 +2057,9 @@ class ModManager:
         """
         Create a backup of current mods.
 
+        Skipped when the newest existing backup was taken from the same
+        installed mods (see _mods_fingerprint); its path is returned instead.
+
         Returns:
             Path to backup directory, or None if no mods to backup
         """
@@ -1649,13 +2073,42 @@ class ModManager:
 
         backup_dir.mkdir(parents=True, exist_ok=True)
 
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        fingerprint = self._mods_fingerprint()
+        sidecars = sorted(backup_dir.glob("mods_backup_*.sha256"))
+        if sidecars:
+            latest = sidecars[-1]
+            latest_backup = latest.with_suffix("")
+            try:
+                if latest_backup.is_dir() and latest.read_text(encoding="utf-8").strip() == fingerprint:
+                    logger.info(f"Backup already current: {latest_backup}")
+                    return str(latest_backup)
+            except OSError:
+                pass
+
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         backup_path = backup_dir / f"mods_backup_{timestamp}"
 
         shutil.copytree(self.mods_dir, backup_path)
+        backup_path.with_name(backup_path.name + ".sha256").write_text(fingerprint, encoding="utf-8")
         return str(backup_path)
 
+    def _mods_fingerprint(self) -> str:
+        """
+        Hash of the installed mod folders and their .uplugin files (name,
+        size, mtime). Costs one stat per mod instead of reading mod contents.
+        """
+        entries = []
+        for mod_dir in self.mods_dir.iterdir():
+            if not mod_dir.is_dir():
+                continue
+            for uplugin in mod_dir.glob("*.uplugin"):
+                st = uplugin.stat()
+                entries.append((mod_dir.name, uplugin.name, st.st_size, st.st_mtime_ns))
+                break
+            else:
+                entries.append((mod_dir.name, "", 0, 0))
+        return hashlib.sha256(repr(sorted(entries)).encode("utf-8")).hexdigest()
+
 
 @dataclass
 class GapAnalysisResult:
@@ -1708,6 +2161,18 @@ class PreVerifyInstaller:
         self.resolved_mods: Dict[str, ResolvedMod] = {}
         self.gap_analysis: Optional[GapAnalysisResult] = None
 
+        # Set by cancel(); checked between phases and per download chunk
+        self.cancel_event = threading.Event()
+
+    def cancel(self):
+        """Ask the running installation to stop as soon as possible."""
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancel() has been called."""
+        return self.cancel_event.is_set()
+
     def phase1_resolve_dependencies(
         self,
         mod_references: List[str],
@@ -1776,6 +2241,10 @@ class PreVerifyInstaller:
         if progress_callback:
             progress_callback("", "Phase 2: Scanning installed mods...")
 
+        # Handshake with the download host while the disk scan runs, so the
+        # first phase 4 download reuses an open connection
+        get_download_pool().submit(self.downloader.warm_up)
+
         installed = self.scanner.scan_installed()
 
         details.append(f"Found {len(installed)} installed mod folders")
@@ -1922,25 +2391,60 @@ class PreVerifyInstaller:
         fail_count = 0
         failed_mods = []
 
-        for i, ref in enumerate(mods_to_install):
+        # Downloads overlap; ModDownloader serializes the extraction step.
+        # Byte progress is summed over every download started so far so the
+        # bar moves forward instead of jumping between mods.
+        progress_lock = threading.Lock()
+        byte_progress: Dict[str, Tuple[int, int]] = {}
+
+        def install(index: int, ref: str, resolved: ResolvedMod) -> InstallResult:
+            if self.cancelled:
+                # Queued behind other downloads and never started
+                return InstallResult(mod_reference=ref, success=False, message="Cancelled")
             if progress_callback:
-                progress_callback(ref, f"Installing {ref} ({i+1}/{len(mods_to_install)})...")
+                progress_callback(ref, f"Installing {ref} ({index+1}/{len(mods_to_install)})...")
 
+            def on_bytes(downloaded: int, total: int):
+                with progress_lock:
+                    byte_progress[ref] = (downloaded, total)
+                    done = sum(d for d, _ in byte_progress.values())
+                    size = sum(t for _, t in byte_progress.values())
+                download_progress_callback(done, size)
+
+            return self.downloader.download_and_install(
+                ref,
+                resolved.download_url,
+                on_bytes if download_progress_callback else None,
+                self.cancel_event
+            )
+
+        pool = get_download_pool()
+        futures = {}
+        for i, ref in enumerate(mods_to_install):
             resolved = self.resolved_mods.get(ref)
             if not resolved or not resolved.download_url:
+                futures[ref] = None
+                continue
+            futures[ref] = pool.submit(install, i, ref, resolved)
+
+        # The Mods folder changes from here on; drop the phase 2 scan
+        self.scanner.invalidate()
+
+        # Report in install order, not completion order
+        for ref, future in futures.items():
+            if future is None:
                 details.append(f"  [SKIP] {ref}: No download URL available")
                 fail_count += 1
                 failed_mods.append(ref)
                 continue
 
-            result = self.downloader.download_and_install(
-                ref,
-                resolved.download_url,
-                download_progress_callback
-            )
+            try:
+                result = future.result()
+            except Exception as e:
+                result = InstallResult(mod_reference=ref, success=False, message=f"Installation error: {e}")
 
             if result.success:
-                details.append(f"  [OK] {ref} v{resolved.version}: {result.message}")
+                details.append(f"  [OK] {ref} v{self.resolved_mods[ref].version}: {result.message}")
                 success_count += 1
             else:
                 details.append(f"  [FAIL] {ref}: {result.message}")
@@ -1951,6 +2455,8 @@ class PreVerifyInstaller:
         message = f"Installed {success_count}/{len(mods_to_install)} mods"
         if failed_mods:
             message += f" ({fail_count} failed)"
+        if self.cancelled:
+            message += " - cancelled"
 
         return InstallPhaseResult(
             phase_name="Install Missing",
@@ -2075,7 +2581,7 @@ class PreVerifyInstaller:
 
     def cleanup_obsolete_mods(
         self,
-        valid_mod_refs: List[str],
+        valid_mod_refs: Iterable[str],
         progress_callback: Optional[Callable[[str, str], None]] = None
     ) -> Tuple[List[str], List[str]]:
         """
@@ -2083,7 +2589,8 @@ class PreVerifyInstaller:
         This cleans up broken/obsolete mods that may cause game errors.
 
         Args:
-            valid_mod_refs: List of mod references that should remain installed
+            valid_mod_refs: Mod references that should remain installed
+                (pass a set/frozenset to skip the internal copy)
             progress_callback: Optional callback(mod_ref, status_message)
 
         Returns:
@@ -2102,7 +2609,10 @@ class PreVerifyInstaller:
         installed_folders = [d.name for d in self.mods_dir.iterdir() if d.is_dir()]
 
         # Find mods to remove (installed but not in valid list)
-        valid_set = set(valid_mod_refs)
+        valid_set: AbstractSet[str] = (
+            valid_mod_refs if isinstance(valid_mod_refs, (set, frozenset))
+            else frozenset(valid_mod_refs)
+        )
         to_remove = [ref for ref in installed_folders if ref not in valid_set]
 
         if not to_remove:
@@ -2125,6 +2635,7 @@ class PreVerifyInstaller:
                 failed.append(mod_ref)
                 logger.error(f"Failed to remove {mod_ref}: {e}")
 
+        self.scanner.invalidate()
         return removed, failed
 
 
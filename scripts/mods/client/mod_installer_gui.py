@@ -4,12 +4,16 @@ A modern desktop application for installing Satisfactory mods.
 """
 
 import os
+import stat
 import sys
 import threading
 import queue
-from datetime import datetime
+import time
+from concurrent.futures import as_completed
+from dataclasses import dataclass
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Tuple
 
 import customtkinter as ctk
 
@@ -17,17 +21,17 @@ import customtkinter as ctk
 try:
     from mod_installer_core import (
         GamePathDetector, ModManager, Mod, InstallResult,
-        FicsitAPIClient, FicsitCLI, get_embedded_mods_config,
+        FicsitAPIClient, FicsitCLI,
         PreVerifyInstaller, DependencyResolver, ModScanner,
-        VersionCache, UpdateChecker, ModVersion, UpdateInfo
+        VersionCache, UpdateChecker, ModVersion, UpdateInfo, get_download_pool
     )
 except ImportError:
     # When running as packaged exe, might need different import
     from .mod_installer_core import (
         GamePathDetector, ModManager, Mod, InstallResult,
-        FicsitAPIClient, FicsitCLI, get_embedded_mods_config,
+        FicsitAPIClient, FicsitCLI,
         PreVerifyInstaller, DependencyResolver, ModScanner,
-        VersionCache, UpdateChecker, ModVersion, UpdateInfo
+        VersionCache, UpdateChecker, ModVersion, UpdateInfo, get_download_pool
     )
 
 
@@ -35,6 +39,257 @@ except ImportError:
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
+# How often (ms) the Tk thread drains UI operations posted by worker threads
+UI_PUMP_INTERVAL_MS = 50
+
+# Download progress is only published when this much time has passed or the
+# fraction complete has moved by at least this much since the last update
+PROGRESS_MIN_INTERVAL = 1 / 30
+PROGRESS_MIN_STEP = 0.01
+
+# Oldest log lines are dropped once the log textbox holds more than this
+LOG_MAX_LINES = 1000
+
+
+@lru_cache(maxsize=8)
+def _is_satisfactory_root(path: str) -> bool:
+    """Check for a FactoryGame folder with a single stat. Cached for re-browses."""
+    try:
+        return stat.S_ISDIR(os.stat(os.path.join(path, "FactoryGame")).st_mode)
+    except OSError:
+        return False
+
+
+@lru_cache(maxsize=16)
+def _font(size: int, weight: str = "normal") -> ctk.CTkFont:
+    """Shared CTkFont per (size, weight); needs the Tk root to exist first."""
+    return ctk.CTkFont(size=size, weight=weight)
+
+
+@dataclass
+class ModRow:
+    """One line of the mod list: a category header, a mod, or a mod description."""
+    kind: str  # "header", "mod" or "desc"
+    text: str
+    mod_reference: str = ""
+    required: bool = False
+
+
+class _RowSlot:
+    """Pooled widgets for one visible line of a VirtualModList."""
+
+    def __init__(self, master, height: int):
+        self.frame = ctk.CTkFrame(master, fg_color="transparent", height=height)
+        self.frame.grid_propagate(False)
+        self.frame.grid_columnconfigure(0, weight=1)
+        self.frame.grid_columnconfigure(1, weight=0)
+        self.frame.grid_rowconfigure(0, weight=1)
+
+        self.header = ctk.CTkLabel(
+            self.frame,
+            text="",
+            font=_font(14, "bold")
+        )
+        self.checkbox = ctk.CTkCheckBox(self.frame, text="", onvalue=True, offvalue=False)
+        self.dropdown = ctk.CTkComboBox(
+            self.frame,
+            values=["Latest"],
+            width=100,
+            state="readonly"
+        )
+        self.desc = ctk.CTkLabel(
+            self.frame,
+            text="",
+            text_color="gray",
+            font=_font(11)
+        )
+
+        # Grid everything once so grid() can later restore these options,
+        # then hide until the slot is bound to a row
+        self.header.grid(row=0, column=0, columnspan=2, sticky="sw", padx=10)
+        self.checkbox.grid(row=0, column=0, sticky="w", padx=30)
+        self.dropdown.grid(row=0, column=1, sticky="e", padx=15)
+        self.desc.grid(row=0, column=0, columnspan=2, sticky="nw", padx=60)
+        for widget in (self.header, self.checkbox, self.dropdown, self.desc):
+            widget.grid_remove()
+
+        self.kind: Optional[str] = None
+        self.mod_reference: Optional[str] = None
+        self.bound_versions: Optional[List[str]] = None
+
+    def show_kind(self, kind: Optional[str]):
+        """Show only the widgets used by this row kind."""
+        if kind == self.kind:
+            return
+        wanted = {
+            "header": (self.header,),
+            "mod": (self.checkbox, self.dropdown),
+            "desc": (self.desc,),
+        }
+        for widget in wanted.get(self.kind, ()):
+            widget.grid_remove()
+        for widget in wanted.get(kind, ()):
+            widget.grid()
+        self.kind = kind
+
+
+class VirtualModList(ctk.CTkFrame):
+    """
+    Scrollable mod list that only has widgets for the rows in view.
+
+    Rows are plain ModRow data. A pool of row widgets, sized to the
+    viewport, is rebound to whichever rows are visible as the list
+    scrolls, so the number of widgets does not grow with the number of mods.
+    """
+
+    ROW_HEIGHT = 30
+    INITIAL_ROWS = 20  # Rows shown before the first layout reports a height
+    WHEEL_ROWS = 3
+
+    def __init__(
+        self,
+        master,
+        mod_vars: Dict[str, ctk.BooleanVar],
+        version_vars: Dict[str, ctk.StringVar],
+        available_versions: Dict[str, List[str]],
+        label_text: str = "",
+        **kwargs
+    ):
+        super().__init__(master, **kwargs)
+        self._mod_vars = mod_vars
+        self._version_vars = version_vars
+        self._available_versions = available_versions
+        self._rows: List[ModRow] = []
+        self._first = 0
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(1, weight=1)
+
+        if label_text:
+            label = ctk.CTkLabel(self, text=label_text)
+            label.grid(row=0, column=0, columnspan=2, sticky="ew", padx=5, pady=(5, 0))
+
+        self._body = ctk.CTkFrame(self, fg_color="transparent")
+        self._body.grid(row=1, column=0, sticky="nsew", padx=(5, 0), pady=5)
+        self._body.grid_propagate(False)
+        self._body.grid_columnconfigure(0, weight=1)
+
+        self._scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self._scrollbar.grid(row=1, column=1, sticky="ns", padx=(0, 5), pady=5)
+
+        # Slots are created on demand when the viewport grows; never destroyed
+        self._slots: List[_RowSlot] = []
+
+        self.bind_all("<MouseWheel>", self._on_mousewheel, add="+")
+        self.bind_all("<Button-4>", self._on_mousewheel, add="+")
+        self.bind_all("<Button-5>", self._on_mousewheel, add="+")
+        self._body.bind("<Configure>", lambda _event: self._render())
+
+    def set_rows(self, rows: List[ModRow]):
+        """Replace the list contents and scroll back to the top."""
+        self._rows = rows
+        self._first = 0
+        # Variables are recreated on reload, so force every slot to rebind
+        for slot in self._slots:
+            slot.mod_reference = None
+            slot.bound_versions = None
+        self._render()
+
+    def refresh(self, mod_reference: Optional[str] = None):
+        """Re-read bound data for visible rows (only mod_reference's, if given)."""
+        for slot, row in self._visible_pairs():
+            if mod_reference is None or row.mod_reference == mod_reference:
+                self._bind_slot(slot, row)
+
+    def scroll_to(self, first: int):
+        """Show rows starting at index first (clamped to the valid range)."""
+        first = max(0, min(first, len(self._rows) - self._visible_count()))
+        if first != self._first:
+            self._first = first
+            self._render()
+
+    def _visible_count(self) -> int:
+        height = self._body.winfo_height()
+        fits = max(1, height // self.ROW_HEIGHT) if height > 1 else self.INITIAL_ROWS
+        return min(fits, len(self._rows))
+
+    def _ensure_slots(self, count: int):
+        """Grow the slot pool to at least count slots."""
+        for i in range(len(self._slots), count):
+            slot = _RowSlot(self._body, self.ROW_HEIGHT)
+            slot.frame.grid(row=i, column=0, sticky="ew")
+            slot.frame.grid_remove()
+            self._slots.append(slot)
+
+    def _visible_pairs(self):
+        end = self._first + self._visible_count()
+        return zip(self._slots, self._rows[self._first:end])
+
+    def _render(self):
+        """Bind pool slots to the rows currently in view and hide the rest."""
+        count = self._visible_count()
+        self._ensure_slots(count)
+        for i, slot in enumerate(self._slots):
+            if i < count:
+                slot.frame.grid()
+                self._bind_slot(slot, self._rows[self._first + i])
+            else:
+                slot.frame.grid_remove()
+
+        total = len(self._rows)
+        if total:
+            self._scrollbar.set(self._first / total, (self._first + count) / total)
+        else:
+            self._scrollbar.set(0, 1)
+
+    def _bind_slot(self, slot: _RowSlot, row: ModRow):
+        slot.show_kind(row.kind)
+        if row.kind != "mod":
+            slot.mod_reference = None
+            (slot.header if row.kind == "header" else slot.desc).configure(text=row.text)
+            return
+
+        ref = row.mod_reference
+        if slot.mod_reference != ref:
+            slot.checkbox.configure(
+                text=row.text,
+                variable=self._mod_vars[ref],
+                state="disabled" if row.required else "normal"
+            )
+            slot.dropdown.configure(variable=self._version_vars[ref])
+            slot.mod_reference = ref
+        versions = self._available_versions.get(ref, ["Latest"])
+        if versions is not slot.bound_versions:
+            slot.dropdown.configure(values=versions)
+            slot.bound_versions = versions
+
+    def _on_scrollbar(self, *args):
+        if not args:
+            return
+        if args[0] == "moveto":
+            self.scroll_to(int(float(args[1]) * len(self._rows)))
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if len(args) > 2 and args[2] == "pages":
+                step *= self._visible_count()
+            self.scroll_to(self._first + step)
+
+    def _on_mousewheel(self, event):
+        # bind_all sees every wheel event; only react over this widget
+        own_path = str(self)
+        widget_path = str(event.widget)
+        if widget_path != own_path and not widget_path.startswith(own_path + "."):
+            return
+        if getattr(event, "num", None) == 4:
+            step = -self.WHEEL_ROWS
+        elif getattr(event, "num", None) == 5:
+            step = self.WHEEL_ROWS
+        elif sys.platform == "darwin":
+            step = -event.delta
+        else:
+            step = -int(event.delta / 120) * self.WHEEL_ROWS
+        self.scroll_to(self._first + step)
+
 
 class ModInstallerApp(ctk.CTk):
     """Main application window."""
@@ -60,27 +315,111 @@ class ModInstallerApp(ctk.CTk):
         self.game_path: Optional[str] = None
         self.mod_manager: Optional[ModManager] = None
         self.pre_verify_installer: Optional[PreVerifyInstaller] = None
-        self.mod_checkboxes: Dict[str, ctk.CTkCheckBox] = {}
+        # Installer of the running update job, if any (see _on_close)
+        self._update_installer: Optional[PreVerifyInstaller] = None
         self.mod_vars: Dict[str, ctk.BooleanVar] = {}
+        # Selection vars and their required flags as parallel lists, for the
+        # bulk select/deselect buttons
+        self._all_vars: List[ctk.BooleanVar] = []
+        self._required_mask: List[bool] = []
+        # Refs whose selection var is True, kept current by a var trace so
+        # building the install/verify list needs no Tcl calls
+        self._selected: set = set()
+        # Rows currently shown in the mod list, to skip rebuilding on reload
+        self._last_rows: List[ModRow] = []
         self.is_installing = False
-        self.install_queue = queue.Queue()
+        # (job name, callable) pairs run one at a time by _worker_loop, so
+        # version loads and update checks never race on the API client/cache
+        self.install_queue: "queue.Queue[Tuple[str, Callable[[], None]]]" = queue.Queue()
+        threading.Thread(target=self._worker_loop, name="modinst-api", daemon=True).start()
+
+        # UI operations posted from background threads, applied in batches
+        # on the Tk thread by _pump_ui_queue()
+        self._ui_queue: "queue.SimpleQueue[Tuple[Callable, tuple, dict]]" = queue.SimpleQueue()
+
+        # Pending (timestamp, message) log lines, flushed by _flush_log()
+        self._log_queue: "queue.SimpleQueue[Tuple[str, str]]" = queue.SimpleQueue()
+
+        # Last (second, formatted) log timestamp, reused while the second
+        # hasn't changed. Kept as one tuple so worker threads read a
+        # consistent pair.
+        self._log_ts: Tuple[int, str] = (-1, "")
+
+        # Last published download progress (monotonic time, fraction)
+        self._last_progress_ts = 0.0
+        self._last_progress_pct = -1.0
+
+        # Status updates from workers go through the UI queue (so they keep
+        # their order relative to completion handlers), tagged with a
+        # sequence number; only the newest one touches the label
+        self._status_seq = 0
+        self._status_lock = threading.Lock()
 
         # Version selection state
         self.mod_version_vars: Dict[str, ctk.StringVar] = {}
-        self.mod_version_dropdowns: Dict[str, ctk.CTkComboBox] = {}
         self.mod_available_versions: Dict[str, List[str]] = {}
 
         # Update checking state
         self.api_client: Optional[FicsitAPIClient] = None
         self.version_cache: Optional[VersionCache] = None
         self.update_checker: Optional[UpdateChecker] = None
+        self._prefetch_thread: Optional[threading.Thread] = None
         self.pending_updates: List[UpdateInfo] = []
         self.update_checkboxes: Dict[str, ctk.BooleanVar] = {}
 
         # Setup UI
         self._create_widgets()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        self._pump_ui_queue()
         self._detect_game_path()
 
+    def _on_close(self):
+        """Stop background work and close the window."""
+        if self.is_installing and self.pre_verify_installer:
+            self.pre_verify_installer.cancel()
+        if self._update_installer:
+            self._update_installer.cancel()
+        self.destroy()
+
+    def _post_ui(self, func: Callable, *args, **kwargs):
+        """Queue func(*args, **kwargs) to run on the Tk thread. Safe from any thread."""
+        self._ui_queue.put((func, args, kwargs))
+
+    def _worker_loop(self):
+        """Run queued API jobs in order on one long-lived thread."""
+        while True:
+            name, job = self.install_queue.get()
+            try:
+                job()
+            except Exception as e:
+                self.log(f"[ERROR] {name} failed: {e}")
+            finally:
+                self.install_queue.task_done()
+
+    def _set_status_async(self, text: str):
+        """Post a status label update from a worker; only the latest is applied."""
+        with self._status_lock:
+            self._status_seq += 1
+            self._ui_queue.put((self._apply_status, (self._status_seq, text), {}))
+
+    def _apply_status(self, seq: int, text: str):
+        """Show a posted status unless a newer one is already queued."""
+        if seq == self._status_seq:
+            self.status_label.configure(text=text)
+
+    def _pump_ui_queue(self):
+        """Apply all pending UI operations in one pass, then re-arm."""
+        try:
+            while True:
+                try:
+                    func, args, kwargs = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                func(*args, **kwargs)
+            self._flush_log()
+        finally:
+            self.after(UI_PUMP_INTERVAL_MS, self._pump_ui_queue)
+
     def _create_widgets(self):
         """Create all UI widgets."""
         # Configure grid
@@ -118,7 +457,7 @@ class ModInstallerApp(ctk.CTk):
         title_label = ctk.CTkLabel(
             header_frame,
             text="Satisfactory Mod Installer",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=_font(24, "bold")
         )
         title_label.grid(row=0, column=0, sticky="w")
 
@@ -210,15 +549,15 @@ class ModInstallerApp(ctk.CTk):
         )
         self.fetch_versions_btn.pack(side="left", padx=5)
 
-        # Scrollable frame for mods
-        self.mod_list_frame = ctk.CTkScrollableFrame(
+        # Virtualized list of mods - widgets only exist for visible rows
+        self.mod_list_frame = VirtualModList(
             list_container,
+            self.mod_vars,
+            self.mod_version_vars,
+            self.mod_available_versions,
             label_text="Available Mods"
         )
         self.mod_list_frame.grid(row=1, column=0, sticky="nsew", padx=10, pady=10)
-        # Configure columns: 0=checkbox (expand), 1=version dropdown (fixed)
-        self.mod_list_frame.grid_columnconfigure(0, weight=1)
-        self.mod_list_frame.grid_columnconfigure(1, weight=0, minsize=120)
 
     def _create_updates_panel(self):
         """Create collapsible updates panel."""
@@ -236,7 +575,7 @@ class ModInstallerApp(ctk.CTk):
         self.updates_header = ctk.CTkLabel(
             header_frame,
             text="Updates Available",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(14, "bold"),
             text_color="#4da6ff"
         )
         self.updates_header.grid(row=0, column=0, sticky="w")
@@ -298,7 +637,7 @@ class ModInstallerApp(ctk.CTk):
         self.status_label = ctk.CTkLabel(
             progress_frame,
             text="Ready",
-            font=ctk.CTkFont(size=12)
+            font=_font(12)
         )
         self.status_label.grid(row=1, column=0, sticky="w", pady=5)
 
@@ -325,7 +664,7 @@ class ModInstallerApp(ctk.CTk):
         self.install_btn = ctk.CTkButton(
             btn_frame,
             text="Install Selected Mods",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(14, "bold"),
             height=40,
             command=self._start_installation
         )
@@ -335,7 +674,7 @@ class ModInstallerApp(ctk.CTk):
         self.check_updates_btn = ctk.CTkButton(
             btn_frame,
             text="Check Updates",
-            font=ctk.CTkFont(size=14),
+            font=_font(14),
             height=40,
             fg_color="#2d5a27",
             hover_color="#3d7a37",
@@ -347,7 +686,7 @@ class ModInstallerApp(ctk.CTk):
         self.verify_btn = ctk.CTkButton(
             btn_frame,
             text="Verify Installation",
-            font=ctk.CTkFont(size=14),
+            font=_font(14),
             height=40,
             fg_color="gray40",
             command=self._verify_installation
@@ -367,11 +706,25 @@ class ModInstallerApp(ctk.CTk):
         """Auto-detect game installation path."""
         self.log("Detecting Satisfactory installation...")
 
-        def detect_thread():
-            path = GamePathDetector.detect()
-            self.after(0, lambda: self._on_path_detected(path))
+        # A path remembered from a previous run only needs one stat to confirm
+        cached = GamePathDetector.load_cached()
+        if cached:
+            self._on_path_detected(cached)
+            return
+
+        # Daemon thread: a probe stuck on a network drive must not block exit
+        threading.Thread(target=self._detect_in_background, daemon=True).start()
 
-        threading.Thread(target=detect_thread, daemon=True).start()
+    def _detect_in_background(self):
+        """Run detection off the Tk thread and hand the result back to it."""
+        try:
+            path = GamePathDetector.detect()
+        except Exception as e:
+            self.log(f"[WARN] Game path detection failed: {e}")
+            path = None
+        if path:
+            GamePathDetector.remember(path)
+        self._post_ui(self._on_path_detected, path)
 
     def _on_path_detected(self, path: Optional[str]):
         """Handle detected game path."""
@@ -400,8 +753,8 @@ class ModInstallerApp(ctk.CTk):
 
         if path:
             # Validate path
-            factory_game = os.path.join(path, "FactoryGame")
-            if os.path.isdir(factory_game):
+            if _is_satisfactory_root(path):
+                GamePathDetector.remember(path)
                 self.game_path = path
                 self.path_entry.delete(0, "end")
                 self.path_entry.insert(0, path)
@@ -416,135 +769,130 @@ class ModInstallerApp(ctk.CTk):
                 self.log("[ERROR] Invalid path selected")
 
     def _load_mods(self):
-        """Load mod list and create checkboxes with version dropdowns."""
+        """Load mod list and populate the mod list rows."""
         if not self.game_path:
             return
 
-        # Clear existing widgets
-        for widget in self.mod_list_frame.winfo_children():
-            widget.destroy()
-        self.mod_checkboxes.clear()
-        self.mod_vars.clear()
-        self.mod_version_vars.clear()
-        self.mod_version_dropdowns.clear()
-        self.mod_available_versions.clear()
-
-        # Initialize mod manager and helpers
+        # Initialize mod manager and helpers. The API client (and its pooled
+        # HTTP session) and the on-disk version cache live for the whole app,
+        # so re-picking a path doesn't reload the cache or reconnect.
         self.mod_manager = ModManager(self.game_path)
-        self.api_client = FicsitAPIClient()
-        self.version_cache = VersionCache()
+        if self.api_client is None:
+            self.api_client = FicsitAPIClient()
+        if self.version_cache is None:
+            self.version_cache = VersionCache()
         mods_dir = Path(self.game_path) / "FactoryGame" / "Mods"
         self.update_checker = UpdateChecker(mods_dir, self.api_client, self.version_cache)
 
         # If no mods loaded from config, use embedded config
         if not self.mod_manager.mods:
             self.log("[INFO] Using embedded mod configuration")
-            for mod_data in get_embedded_mods_config():
-                mod = Mod(
-                    name=mod_data["name"],
-                    mod_reference=mod_data["mod_reference"],
-                    category=mod_data.get("category", "other"),
-                    required=mod_data.get("required", False),
-                    priority=mod_data.get("priority", 99),
-                    description=mod_data.get("description", "")
-                )
-                self.mod_manager.mods.append(mod)
+            self.mod_manager.load_embedded_config()
 
-        # Get mods by category
+        # Get mods by category (memoized on the manager)
         categories = self.mod_manager.get_mods_by_category()
 
-        row = 0
+        # Build the list as plain rows; VirtualModList only creates widgets
+        # for the ones in view
+        rows: List[ModRow] = []
         for category in self.CATEGORY_ORDER:
-            if category not in categories:
+            mods = categories.get(category)
+            if not mods:
                 continue
 
-            mods = categories[category]
             category_name = self.CATEGORY_NAMES.get(category, category.title())
+            rows.append(ModRow("header", category_name))
 
-            # Category header (spans both columns)
-            header = ctk.CTkLabel(
-                self.mod_list_frame,
-                text=category_name,
-                font=ctk.CTkFont(size=14, weight="bold")
-            )
-            header.grid(row=row, column=0, columnspan=2, sticky="w", padx=10, pady=(15, 5))
-            row += 1
-
-            # Mod rows
             for mod in mods:
-                # Mod row frame for checkbox + dropdown
-                mod_row_frame = ctk.CTkFrame(self.mod_list_frame, fg_color="transparent")
-                mod_row_frame.grid(row=row, column=0, columnspan=2, sticky="ew", padx=10, pady=2)
-                mod_row_frame.grid_columnconfigure(0, weight=1)
-                mod_row_frame.grid_columnconfigure(1, weight=0)
-
-                # Checkbox
-                var = ctk.BooleanVar(value=mod.required)
-                self.mod_vars[mod.mod_reference] = var
-
                 checkbox_text = f"{mod.name}"
                 if mod.required:
                     checkbox_text += " (Required)"
-
-                checkbox = ctk.CTkCheckBox(
-                    mod_row_frame,
-                    text=checkbox_text,
-                    variable=var,
-                    onvalue=True,
-                    offvalue=False
-                )
-                checkbox.grid(row=0, column=0, sticky="w", padx=20)
-                self.mod_checkboxes[mod.mod_reference] = checkbox
-
-                if mod.required:
-                    checkbox.configure(state="disabled")
-
-                # Version dropdown (defaults to "Latest")
-                version_var = ctk.StringVar(value="Latest")
-                self.mod_version_vars[mod.mod_reference] = version_var
-                self.mod_available_versions[mod.mod_reference] = ["Latest"]
-
-                version_dropdown = ctk.CTkComboBox(
-                    mod_row_frame,
-                    variable=version_var,
-                    values=["Latest"],
-                    width=100,
-                    state="readonly"
-                )
-                version_dropdown.grid(row=0, column=1, sticky="e", padx=5)
-                self.mod_version_dropdowns[mod.mod_reference] = version_dropdown
-
-                row += 1
+                rows.append(ModRow("mod", checkbox_text, mod.mod_reference, mod.required))
 
                 # Description
                 if mod.description:
-                    desc_label = ctk.CTkLabel(
-                        self.mod_list_frame,
-                        text=f"    {mod.description}",
-                        text_color="gray",
-                        font=ctk.CTkFont(size=11)
-                    )
-                    desc_label.grid(row=row, column=0, columnspan=2, sticky="w", padx=50, pady=(0, 5))
-                    row += 1
+                    rows.append(ModRow("desc", mod.description, mod.mod_reference))
+
+        if rows == self._last_rows:
+            # Same list as before (e.g. re-browsing the same install): keep
+            # the bound variables and loaded versions, just reset selection
+            self._select_required()
+            for version_var in self.mod_version_vars.values():
+                version_var.set("Latest")
+        else:
+            # Selection and version state (versions default to "Latest")
+            self.mod_vars.clear()
+            self._all_vars.clear()
+            self._required_mask.clear()
+            self._selected.clear()
+            self.mod_version_vars.clear()
+            self.mod_available_versions.clear()
+            for row in rows:
+                if row.kind != "mod":
+                    continue
+                var = ctk.BooleanVar(value=row.required)
+                var.trace_add("write", partial(self._on_selection_write, row.mod_reference, var))
+                if row.required:
+                    self._selected.add(row.mod_reference)
+                self.mod_vars[row.mod_reference] = var
+                self._all_vars.append(var)
+                self._required_mask.append(row.required)
+                self.mod_version_vars[row.mod_reference] = ctk.StringVar(value="Latest")
+                self.mod_available_versions[row.mod_reference] = ["Latest"]
+
+            self.mod_list_frame.set_rows(rows)
+            self._last_rows = rows
 
         self.log(f"[OK] Loaded {len(self.mod_manager.mods)} mods")
         self.log("[INFO] Click 'Load Versions' to fetch available versions")
 
+        # Fetch dependency metadata while the user is picking mods so
+        # phase 1 of the installation is served from cache. One prefetch at
+        # a time, and only for mods the cache doesn't already cover.
+        self._start_metadata_prefetch()
+
+    def _start_metadata_prefetch(self):
+        """Start a background metadata prefetch unless one is running or nothing is missing."""
+        if self._prefetch_thread and self._prefetch_thread.is_alive():
+            return
+        missing = self.api_client.missing_mod_metadata(self.mod_manager.mod_refs)
+        if not missing:
+            return
+        self._prefetch_thread = threading.Thread(
+            target=self.api_client.prefetch_mod_metadata,
+            args=(missing,),
+            daemon=True
+        )
+        self._prefetch_thread.start()
+
+    def _on_selection_write(self, mod_ref: str, var: ctk.BooleanVar, *_trace_args):
+        """Mirror a selection var into self._selected."""
+        if var.get():
+            self._selected.add(mod_ref)
+        else:
+            self._selected.discard(mod_ref)
+
+    def _selected_refs(self) -> List[str]:
+        """Selected mod references, in config order."""
+        if not self.mod_manager:
+            return []
+        return [ref for ref in self.mod_manager.mod_refs if ref in self._selected]
+
     def _select_all(self):
         """Select all mods."""
-        for ref, var in self.mod_vars.items():
+        for var in self._all_vars:
             var.set(True)
 
     def _deselect_all(self):
         """Deselect all optional mods (keep required)."""
-        for mod in self.mod_manager.mods:
-            if not mod.required:
-                self.mod_vars[mod.mod_reference].set(False)
+        for var, required in zip(self._all_vars, self._required_mask):
+            if not required:
+                var.set(False)
 
     def _select_required(self):
         """Select only required mods."""
-        for mod in self.mod_manager.mods:
-            self.mod_vars[mod.mod_reference].set(mod.required)
+        for var, required in zip(self._all_vars, self._required_mask):
+            var.set(required)
 
     def _fetch_all_versions(self):
         """Fetch available versions for all mods from the API."""
@@ -558,47 +906,47 @@ class ModInstallerApp(ctk.CTk):
 
         def fetch_thread():
             try:
-                total = len(self.mod_manager.mods)
-                for i, mod in enumerate(self.mod_manager.mods):
-                    # Update status
-                    self.after(0, lambda m=mod, idx=i: self.status_label.configure(
-                        text=f"Fetching versions: {m.name} ({idx+1}/{total})"
-                    ))
-
-                    # Fetch versions using cache
-                    versions = self.version_cache.get_or_fetch(
-                        mod.mod_reference,
-                        self.api_client,
-                        limit=15
-                    )
+                names = self.mod_manager.mod_name_map
+                total = len(names)
+                done = [0]
+                done_lock = threading.Lock()
+
+                def on_result(ref, versions):
+                    with done_lock:
+                        done[0] += 1
+                        idx = done[0]
+                    self._set_status_async(f"Fetching versions: {names[ref]} ({idx}/{total})")
 
                     if versions:
                         # Build version list with "Latest" as first option
-                        version_strings = ["Latest"] + [v.version for v in versions if v.has_windows_target]
-                        self.mod_available_versions[mod.mod_reference] = version_strings
+                        # (the cache only holds Windows-targeted versions)
+                        version_strings = ["Latest"] + [v.version for v in versions]
 
                         # Update dropdown on main thread
-                        self.after(0, lambda ref=mod.mod_reference, vals=version_strings:
-                            self._update_version_dropdown(ref, vals)
-                        )
+                        self._post_ui(self._update_version_dropdown, ref, version_strings)
 
-                self.after(0, self._on_versions_fetched)
+                # Cache misses are fetched concurrently
+                self.version_cache.get_or_fetch_many(
+                    list(names), self.api_client, limit=15, on_result=on_result
+                )
+
+                self._post_ui(self._on_versions_fetched)
 
             except Exception as e:
-                self.after(0, lambda err=str(e): self.log(f"[ERROR] Failed to fetch versions: {err}"))
-                self.after(0, lambda: self.fetch_versions_btn.configure(state="normal", text="Load Versions"))
+                self.log(f"[ERROR] Failed to fetch versions: {e}")
+                self._post_ui(self.fetch_versions_btn.configure, state="normal", text="Load Versions")
 
-        threading.Thread(target=fetch_thread, daemon=True).start()
+        self.install_queue.put(("Version fetch", fetch_thread))
 
     def _update_version_dropdown(self, mod_ref: str, versions: List[str]):
         """Update a version dropdown with new values."""
-        if mod_ref in self.mod_version_dropdowns:
-            dropdown = self.mod_version_dropdowns[mod_ref]
-            dropdown.configure(values=versions)
+        if mod_ref in self.mod_version_vars:
+            self.mod_available_versions[mod_ref] = versions
             # Keep "Latest" selected unless user changed it
             if self.mod_version_vars[mod_ref].get() == "Latest" or \
                self.mod_version_vars[mod_ref].get() not in versions:
                 self.mod_version_vars[mod_ref].set("Latest")
+            self.mod_list_frame.refresh(mod_ref)
 
     def _on_versions_fetched(self):
         """Called when version fetching is complete."""
@@ -620,12 +968,12 @@ class ModInstallerApp(ctk.CTk):
 
         def check_thread():
             try:
-                # Get all mod references and names
-                mod_refs = [mod.mod_reference for mod in self.mod_manager.mods]
-                mod_names = {mod.mod_reference: mod.name for mod in self.mod_manager.mods}
+                # Get all mod references and names (cached on the manager)
+                mod_refs = self.mod_manager.mod_refs
+                mod_names = self.mod_manager.mod_name_map
 
                 def progress_cb(mod_ref, status):
-                    self.after(0, lambda s=status: self.status_label.configure(text=s))
+                    self._set_status_async(status)
 
                 # Check for updates
                 updates = self.update_checker.check_for_updates(
@@ -638,13 +986,13 @@ class ModInstallerApp(ctk.CTk):
                 outdated = [u for u in updates if u.needs_update]
                 self.pending_updates = outdated
 
-                self.after(0, lambda: self._on_updates_checked(updates, outdated))
+                self._post_ui(self._on_updates_checked, updates, outdated)
 
             except Exception as e:
-                self.after(0, lambda err=str(e): self.log(f"[ERROR] Update check failed: {err}"))
-                self.after(0, lambda: self.check_updates_btn.configure(state="normal", text="Check Updates"))
+                self.log(f"[ERROR] Update check failed: {e}")
+                self._post_ui(self.check_updates_btn.configure, state="normal", text="Check Updates")
 
-        threading.Thread(target=check_thread, daemon=True).start()
+        self.install_queue.put(("Update check", check_thread))
 
     def _on_updates_checked(self, all_updates: List[UpdateInfo], outdated: List[UpdateInfo]):
         """Called when update checking is complete."""
@@ -676,6 +1024,10 @@ class ModInstallerApp(ctk.CTk):
 
     def _show_updates_panel(self, updates: List[UpdateInfo]):
         """Display the updates panel with outdated mods."""
+        # Unmap the panel while rebuilding so Tk lays it out once when it is
+        # shown again, instead of after every row
+        self.updates_frame.grid_remove()
+
         # Clear existing items
         for widget in self.updates_list_frame.winfo_children():
             widget.destroy()
@@ -712,7 +1064,7 @@ class ModInstallerApp(ctk.CTk):
                 self.updates_list_frame,
                 text=version_text,
                 text_color="#4da6ff",
-                font=ctk.CTkFont(size=11)
+                font=_font(11)
             )
             version_label.grid(row=i, column=2, padx=10, pady=3)
 
@@ -722,14 +1074,14 @@ class ModInstallerApp(ctk.CTk):
                 text="Update",
                 width=70,
                 height=25,
-                font=ctk.CTkFont(size=11),
+                font=_font(11),
                 fg_color="#2d5a27",
                 hover_color="#3d7a37",
-                command=lambda ref=update.mod_reference: self._update_single_mod(ref)
+                command=partial(self._update_single_mod, update.mod_reference)
             )
             update_btn.grid(row=i, column=3, padx=5, pady=3)
 
-        # Show the panel
+        # Show the panel (single layout pass)
         self.updates_frame.grid()
         self.select_all_updates_var.set(True)
 
@@ -778,57 +1130,76 @@ class ModInstallerApp(ctk.CTk):
 
         def update_thread():
             try:
-                # Initialize installer
+                # Initialize installer; kept so closing the window can cancel
+                # the downloads it starts on the shared (non-daemon) pool
                 installer = PreVerifyInstaller(self.game_path)
+                self._update_installer = installer
 
                 success_count = 0
                 fail_count = 0
 
-                for i, mod_ref in enumerate(mod_refs):
-                    self.after(0, lambda m=mod_ref, idx=i: self.log(f"  Updating {m} ({idx+1}/{len(mod_refs)})..."))
-                    self.after(0, lambda m=mod_ref: self.status_label.configure(text=f"Updating {m}..."))
+                # Latest version info for every mod, cache misses fetched concurrently
+                all_versions = self.version_cache.get_or_fetch_many(mod_refs, self.api_client)
 
-                    # Get latest version info
-                    versions = self.version_cache.get_or_fetch(mod_ref, self.api_client)
+                to_install = []
+                for mod_ref in mod_refs:
+                    versions = all_versions.get(mod_ref)
                     if not versions:
-                        self.after(0, lambda m=mod_ref: self.log(f"    [FAIL] {m}: No versions found"))
+                        self.log(f"    [FAIL] {mod_ref}: No versions found")
                         fail_count += 1
                         continue
 
                     latest = versions[0]
                     if not latest.download_url:
-                        self.after(0, lambda m=mod_ref: self.log(f"    [FAIL] {m}: No download URL"))
+                        self.log(f"    [FAIL] {mod_ref}: No download URL")
                         fail_count += 1
                         continue
 
-                    # Download and install
-                    result = installer.downloader.download_and_install(
-                        mod_ref,
-                        latest.download_url
+                    to_install.append((mod_ref, latest))
+
+                def install(mod_ref, latest):
+                    if installer.cancelled:
+                        return InstallResult(mod_reference=mod_ref, success=False, message="Cancelled")
+                    self.log(f"  Updating {mod_ref}...")
+                    return installer.downloader.download_and_install(
+                        mod_ref, latest.download_url, cancel_event=installer.cancel_event
                     )
 
+                # Downloads overlap on the shared download pool; the
+                # downloader serializes extraction
+                pool = get_download_pool()
+                futures = {
+                    pool.submit(install, mod_ref, latest): (mod_ref, latest)
+                    for mod_ref, latest in to_install
+                }
+                for done, future in enumerate(as_completed(futures), 1):
+                    mod_ref, latest = futures[future]
+                    self._set_status_async(f"Updating mods ({done}/{len(futures)})...")
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        self.log(f"    [FAIL] {mod_ref}: {e}")
+                        fail_count += 1
+                        continue
+
                     if result.success:
-                        self.after(0, lambda m=mod_ref, v=latest.version:
-                            self.log(f"    [OK] {m} updated to v{v}")
-                        )
+                        self.log(f"    [OK] {mod_ref} updated to v{latest.version}")
                         success_count += 1
                         # Invalidate cache for this mod
                         self.version_cache.invalidate(mod_ref)
                     else:
-                        self.after(0, lambda m=mod_ref, msg=result.message:
-                            self.log(f"    [FAIL] {m}: {msg}")
-                        )
+                        self.log(f"    [FAIL] {mod_ref}: {result.message}")
                         fail_count += 1
 
-                self.after(0, lambda s=success_count, f=fail_count:
-                    self._on_update_complete(s, f)
-                )
+                self._post_ui(self._on_update_complete, success_count, fail_count)
 
             except Exception as e:
-                self.after(0, lambda err=str(e): self.log(f"[ERROR] Update failed: {err}"))
-                self.after(0, self._on_update_complete_error)
+                self.log(f"[ERROR] Update failed: {e}")
+                self._post_ui(self._on_update_complete_error)
+            finally:
+                self._update_installer = None
 
-        threading.Thread(target=update_thread, daemon=True).start()
+        self.install_queue.put(("Update", update_thread))
 
     def _on_update_complete(self, success_count: int, fail_count: int):
         """Called when mod update is complete."""
@@ -867,17 +1238,15 @@ class ModInstallerApp(ctk.CTk):
             return
 
         # Get selected mods (just the references)
-        selected_refs = [
-            mod.mod_reference for mod in self.mod_manager.mods
-            if self.mod_vars.get(mod.mod_reference, ctk.BooleanVar()).get()
-        ]
+        selected_refs = self._selected_refs()
 
         if not selected_refs:
             self.log("[WARN] No mods selected")
             return
 
         self.is_installing = True
-        self.install_btn.configure(state="disabled", text="Installing...")
+        # The install button doubles as Cancel while the workflow runs
+        self.install_btn.configure(text="Cancel", command=self._cancel_installation)
         self.verify_btn.configure(state="disabled")
 
         self.log("")
@@ -887,74 +1256,109 @@ class ModInstallerApp(ctk.CTk):
         self.log(f"Selected {len(selected_refs)} mods")
         self.log("")
 
-        # Create backup first
-        try:
-            backup_path = self.mod_manager.backup_mods()
-            if backup_path:
-                self.log(f"[OK] Backup created: {backup_path}")
-        except Exception as e:
-            self.log(f"[WARN] Backup failed: {e}")
-
         # Initialize pre-verify installer
         self.pre_verify_installer = PreVerifyInstaller(self.game_path)
 
         # Run installation in background thread
         threading.Thread(
-            target=self._run_preverify_installation,
-            args=(selected_refs,),
-            daemon=True
+            target=self._run_preverify_installation, args=(selected_refs,), daemon=True
         ).start()
 
+    def _cancel_installation(self):
+        """Stop the running installation after the current step."""
+        if not self.is_installing or not self.pre_verify_installer:
+            return
+        self.pre_verify_installer.cancel()
+        self.install_btn.configure(state="disabled", text="Cancelling...")
+        self.log("[WARN] Cancelling installation...")
+
     def _run_preverify_installation(self, selected_refs: List[str]):
         """Run the pre-verify installation workflow in background."""
         phase_count = 6  # Now includes cleanup phase
         current_phase = 0
+        self._last_progress_ts = 0.0
+        self._last_progress_pct = -1.0
 
         def progress_callback(mod_ref: str, status: str):
             # Update progress and log
-            self.after(0, lambda s=status: self.log(f"  {s}"))
+            self.log("  " + status)
             # Update progress bar based on phase
             progress = (current_phase / phase_count) + (0.1 / phase_count)
-            self.after(0, lambda p=progress, s=status: self._update_progress(p, s))
+            self._post_ui(self._update_progress, progress, status)
 
         def download_progress_callback(downloaded: int, total: int):
-            if total > 0:
-                pct = downloaded / total
-                status = f"Downloading... {downloaded // 1024}KB / {total // 1024}KB"
-                # Progress within phase 4
-                progress = (4 / phase_count) + (pct / phase_count)
-                self.after(0, lambda p=progress, s=status: self._update_progress(p, s))
+            if total <= 0:
+                return
+            pct = downloaded / total
+
+            # Called per chunk - drop updates that wouldn't visibly move the
+            # bar. A new download (pct went backwards) and completion always
+            # get through.
+            now = time.monotonic()
+            if (downloaded < total
+                    and now - self._last_progress_ts < PROGRESS_MIN_INTERVAL
+                    and 0 <= pct - self._last_progress_pct < PROGRESS_MIN_STEP):
+                return
+            self._last_progress_ts = now
+            self._last_progress_pct = pct
+
+            status = f"Downloading... {downloaded // 1024}KB / {total // 1024}KB"
+            # Progress within phase 4
+            progress = (4 / phase_count) + (pct / phase_count)
+            self._post_ui(self._update_progress, progress, status)
+
+        def cancelled() -> bool:
+            # Checked between phases; in-flight downloads watch the same
+            # event and stop at the next chunk
+            if not self.pre_verify_installer.cancelled:
+                return False
+            self.log("")
+            self.log("[WARN] Installation cancelled")
+            self._post_ui(self._on_preverify_complete, False, "Installation cancelled")
+            return True
+
+        # Create backup first (copying the Mods folder can take a while, so
+        # it runs here rather than on the Tk thread)
+        try:
+            backup_path = self.mod_manager.backup_mods()
+            if backup_path:
+                self.log(f"[OK] Mods backed up: {backup_path}")
+        except Exception as e:
+            self.log(f"[WARN] Backup failed: {e}")
 
         try:
             # Phase 0: Cleanup obsolete mods
             current_phase = 0
-            self.after(0, lambda: self.log(""))
-            self.after(0, lambda: self.log("[PHASE 0] Cleanup Obsolete Mods"))
-            self.after(0, lambda: self.log("-" * 40))
-            self.after(0, lambda: self._update_progress(0.05, "Cleaning up obsolete mods..."))
+            self.log("")
+            self.log("[PHASE 0] Cleanup Obsolete Mods")
+            self.log("-" * 40)
+            self._post_ui(self._update_progress, 0.05, "Cleaning up obsolete mods...")
 
             # Get all valid mod refs from our config
-            valid_refs = [mod.mod_reference for mod in (self.mod_manager.mods if self.mod_manager else [])]
+            valid_refs = frozenset(self.mod_manager.mod_refs if self.mod_manager else ())
             removed, failed = self.pre_verify_installer.cleanup_obsolete_mods(
                 valid_refs, progress_callback
             )
 
             if removed:
-                self.after(0, lambda: self.log(f"  Removed {len(removed)} obsolete mod(s):"))
+                self.log(f"  Removed {len(removed)} obsolete mod(s):")
                 for ref in removed:
-                    self.after(0, lambda r=ref: self.log(f"    - {r}"))
+                    self.log(f"    - {ref}")
             else:
-                self.after(0, lambda: self.log("  No obsolete mods to remove"))
+                self.log("  No obsolete mods to remove")
 
             if failed:
-                self.after(0, lambda: self.log(f"  [WARN] Failed to remove {len(failed)} mod(s)"))
+                self.log(f"  [WARN] Failed to remove {len(failed)} mod(s)")
+
+            if cancelled():
+                return
 
             # Phase 1: Resolve dependencies
             current_phase = 1
-            self.after(0, lambda: self.log(""))
-            self.after(0, lambda: self.log("[PHASE 1] Resolving Dependencies"))
-            self.after(0, lambda: self.log("-" * 40))
-            self.after(0, lambda: self._update_progress(0.15, "Resolving dependencies..."))
+            self.log("")
+            self.log("[PHASE 1] Resolving Dependencies")
+            self.log("-" * 40)
+            self._post_ui(self._update_progress, 0.15, "Resolving dependencies...")
 
             result = self.pre_verify_installer.phase1_resolve_dependencies(
                 selected_refs, progress_callback
@@ -962,75 +1366,85 @@ class ModInstallerApp(ctk.CTk):
             self._log_phase_result(result)
 
             if not result.success:
-                self.after(0, lambda: self._on_preverify_complete(False, "Dependency resolution failed"))
+                self._post_ui(self._on_preverify_complete, False, "Dependency resolution failed")
+                return
+
+            if cancelled():
                 return
 
             # Phase 2: Scan installed mods
             current_phase = 2
-            self.after(0, lambda: self.log(""))
-            self.after(0, lambda: self.log("[PHASE 2] Scanning Installed Mods"))
-            self.after(0, lambda: self.log("-" * 40))
-            self.after(0, lambda: self._update_progress(0.35, "Scanning installed mods..."))
+            self.log("")
+            self.log("[PHASE 2] Scanning Installed Mods")
+            self.log("-" * 40)
+            self._post_ui(self._update_progress, 0.35, "Scanning installed mods...")
 
             result = self.pre_verify_installer.phase2_scan_installed(progress_callback)
             self._log_phase_result(result)
 
+            if cancelled():
+                return
+
             # Phase 3: Gap analysis
             current_phase = 3
-            self.after(0, lambda: self.log(""))
-            self.after(0, lambda: self.log("[PHASE 3] Gap Analysis"))
-            self.after(0, lambda: self.log("-" * 40))
-            self.after(0, lambda: self._update_progress(0.5, "Analyzing gaps..."))
+            self.log("")
+            self.log("[PHASE 3] Gap Analysis")
+            self.log("-" * 40)
+            self._post_ui(self._update_progress, 0.5, "Analyzing gaps...")
 
             result = self.pre_verify_installer.phase3_gap_analysis(progress_callback)
             self._log_phase_result(result)
 
             gap = self.pre_verify_installer.gap_analysis
             if gap and gap.all_ok:
-                self.after(0, lambda: self.log(""))
-                self.after(0, lambda: self.log("[OK] All mods already installed and valid!"))
-                self.after(0, lambda: self._on_preverify_complete(True, "All mods already installed"))
+                self.log("")
+                self.log("[OK] All mods already installed and valid!")
+                self._post_ui(self._on_preverify_complete, True, "All mods already installed")
+                return
+
+            if cancelled():
                 return
 
             # Phase 4: Install missing mods
             current_phase = 4
-            self.after(0, lambda: self.log(""))
-            self.after(0, lambda: self.log("[PHASE 4] Installing Missing Mods"))
-            self.after(0, lambda: self.log("-" * 40))
-            self.after(0, lambda: self._update_progress(0.6, "Installing missing mods..."))
+            self.log("")
+            self.log("[PHASE 4] Installing Missing Mods")
+            self.log("-" * 40)
+            self._post_ui(self._update_progress, 0.6, "Installing missing mods...")
 
             result = self.pre_verify_installer.phase4_install_missing(
                 progress_callback, download_progress_callback
             )
             self._log_phase_result(result)
 
+            if cancelled():
+                return
+
             # Phase 5: Final verification
             current_phase = 5
-            self.after(0, lambda: self.log(""))
-            self.after(0, lambda: self.log("[PHASE 5] Final Verification"))
-            self.after(0, lambda: self.log("-" * 40))
-            self.after(0, lambda: self._update_progress(0.85, "Verifying installation..."))
+            self.log("")
+            self.log("[PHASE 5] Final Verification")
+            self.log("-" * 40)
+            self._post_ui(self._update_progress, 0.85, "Verifying installation...")
 
             result = self.pre_verify_installer.phase5_final_verify(progress_callback)
             self._log_phase_result(result)
 
             # Complete
-            self.after(0, lambda r=result: self._on_preverify_complete(
-                r.success, r.message
-            ))
+            self._post_ui(self._on_preverify_complete, result.success, result.message)
 
         except Exception as e:
             import traceback
             error_msg = f"Installation error: {str(e)}"
-            self.after(0, lambda e=error_msg: self.log(f"[ERROR] {e}"))
-            self.after(0, lambda: self.log(traceback.format_exc()))
-            self.after(0, lambda: self._on_preverify_complete(False, error_msg))
+            self.log(f"[ERROR] {error_msg}")
+            self.log(traceback.format_exc())
+            self._post_ui(self._on_preverify_complete, False, error_msg)
 
     def _log_phase_result(self, result):
         """Log details from a phase result."""
-        for detail in result.details:
-            self.after(0, lambda d=detail: self.log(f"  {d}"))
-        self.after(0, lambda r=result: self.log(f"  >> {r.message}"))
+        lines = [f"  {detail}" for detail in result.details]
+        lines.append(f"  >> {result.message}")
+        self.log_lines(lines)
 
     def _update_progress(self, value: float, status: str):
         """Update progress bar and status label."""
@@ -1040,7 +1454,9 @@ class ModInstallerApp(ctk.CTk):
     def _on_preverify_complete(self, success: bool, message: str):
         """Handle pre-verify installation completion."""
         self.is_installing = False
-        self.install_btn.configure(state="normal", text="Install Selected Mods")
+        self.install_btn.configure(
+            state="normal", text="Install Selected Mods", command=self._start_installation
+        )
         self.verify_btn.configure(state="normal")
         self.progress_bar.set(1)
 
@@ -1071,9 +1487,9 @@ class ModInstallerApp(ctk.CTk):
             self.log(f"  Reason: {message}")
             self.status_label.configure(text="Installation failed. Check log for details.")
 
-            # Show what's still missing
+            # Show what's still missing (reuses phase 5's scan when it ran)
             if self.pre_verify_installer:
-                scanner = ModScanner(self.pre_verify_installer.mods_dir)
+                scanner = self.pre_verify_installer.scanner
                 missing = scanner.get_missing_mods(
                     list(self.pre_verify_installer.resolved_mods.keys())
                 )
@@ -1101,22 +1517,34 @@ class ModInstallerApp(ctk.CTk):
         self.log("=" * 50)
 
         # Get selected mod references
-        selected_refs = [
-            mod.mod_reference for mod in (self.mod_manager.mods if self.mod_manager else [])
-            if self.mod_vars.get(mod.mod_reference, ctk.BooleanVar()).get()
-        ]
+        selected_refs = self._selected_refs()
 
         if not selected_refs:
             self.log("[WARN] No mods selected to verify")
             return
 
-        # Use ModScanner to check installed mods
-        mods_dir = Path(self.game_path) / "FactoryGame" / "Mods"
-        scanner = ModScanner(mods_dir)
-
+        self.verify_btn.configure(state="disabled", text="Verifying...")
         self.log("")
         self.log("Scanning mods directory...")
-        installed = scanner.scan_installed()
+
+        # Scan on a worker thread - walking the Mods folder can take seconds
+        # on a cold cache or network drive
+        threading.Thread(target=self._do_verify, args=(selected_refs,), daemon=True).start()
+
+    def _do_verify(self, selected_refs: List[str]):
+        """Scan the mods directory in background and report on the Tk thread."""
+        mods_dir = Path(self.game_path) / "FactoryGame" / "Mods"
+        try:
+            installed = ModScanner(mods_dir).scan_installed()
+        except Exception as e:
+            self._post_ui(self.log, f"[ERROR] Scan failed: {e}")
+            self._post_ui(self.verify_btn.configure, state="normal", text="Verify Installation")
+            return
+        self._post_ui(self._on_verify_scanned, selected_refs, installed)
+
+    def _on_verify_scanned(self, selected_refs: List[str], installed: Dict):
+        """Report verification results from a completed scan."""
+        self.verify_btn.configure(state="normal", text="Verify Installation")
 
         self.log(f"Found {len(installed)} installed mod folders")
         self.log("")
@@ -1126,10 +1554,10 @@ class ModInstallerApp(ctk.CTk):
         missing_count = 0
 
         # First check all selected mods
+        names = self.mod_manager.mod_name_map if self.mod_manager else {}
         self.log("Selected mods status:")
         for ref in selected_refs:
-            mod = next((m for m in self.mod_manager.mods if m.mod_reference == ref), None) if self.mod_manager else None
-            name = mod.name if mod else ref
+            name = names.get(ref, ref)
 
             if ref not in installed:
                 self.log(f"  [!!] {name} - NOT INSTALLED")
@@ -1145,7 +1573,7 @@ class ModInstallerApp(ctk.CTk):
                 valid_count += 1
 
         # Show additional installed mods (dependencies that may have been auto-installed)
-        extra_mods = [ref for ref in installed.keys() if ref not in selected_refs]
+        extra_mods = sorted(installed.keys() - set(selected_refs))
         if extra_mods:
             self.log("")
             self.log("Additional installed mods (dependencies):")
@@ -1179,14 +1607,43 @@ class ModInstallerApp(ctk.CTk):
             self.log("Run 'Install Selected Mods' to repair")
             self.status_label.configure(text="Verification failed - repair needed")
 
+    def _log_timestamp(self) -> str:
+        """Return the current HH:MM:SS, formatting at most once per second."""
+        now = int(time.time())
+        sec, text = self._log_ts
+        if now != sec:
+            text = time.strftime("%H:%M:%S", time.localtime(now))
+            self._log_ts = (now, text)
+        return text
+
     def log(self, message: str):
-        """Add message to log output."""
+        """Queue message for the log output. Safe to call from any thread."""
+        self._log_queue.put((self._log_timestamp(), message))
+
+    def log_lines(self, messages: List[str]):
+        """Queue several messages as one block sharing a single timestamp."""
+        if messages:
+            self._log_queue.put((self._log_timestamp(), "\n".join(messages)))
+
+    def _flush_log(self):
+        """Write all queued log messages to the textbox in a single insert."""
+        items = []
+        while True:
+            try:
+                items.append(self._log_queue.get_nowait())
+            except queue.Empty:
+                break
+        if not items:
+            return
+
+        buf = "".join(f"[{ts}] {msg}\n" if msg.strip() else "\n" for ts, msg in items)
         self.log_text.configure(state="normal")
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        if message.strip():
-            self.log_text.insert("end", f"[{timestamp}] {message}\n")
-        else:
-            self.log_text.insert("end", "\n")
+        self.log_text.insert("end", buf)
+        # Every entry ends in "\n", so "end-1c" sits on the empty line after
+        # the last entry and its line number is one past the entry count
+        lines = int(self.log_text.index("end-1c").split(".")[0]) - 1
+        if lines > LOG_MAX_LINES:
+            self.log_text.delete("1.0", f"{lines - LOG_MAX_LINES + 1}.0")
         self.log_text.see("end")
         self.log_text.configure(state="disabled")
 
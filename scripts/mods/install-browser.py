@@ -9,6 +9,7 @@ Requirements:
 """
 
 import os
+import re
 import sys
 import time
 import shutil
@@ -31,6 +32,66 @@ except ImportError:
     print("Install with: pip3 install playwright && playwright install chromium")
     sys.exit(1)
 
+# Download button lookup: specific selectors first (the page load waits for
+# one of these), then any button/link whose text matches
+# DOWNLOAD_TEXT_PATTERN (matched inside the browser), then as a last resort
+# any icon button
+DOWNLOAD_BUTTON_SELECTORS = (
+    'button:has-text("download")',
+    'button[aria-label*="download" i]',
+    'a:has-text("download")',
+    'button.download',
+    '[data-testid*="download"]',
+)
+ICON_BUTTON_SELECTOR = 'button:has(svg)'
+DOWNLOAD_TEXT_PATTERN = re.compile(r"download|install", re.IGNORECASE)
+
+# Requests the download button doesn't depend on; aborted to speed up page loads.
+# Stylesheets are kept because visibility checks depend on layout.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "plausible.io",
+)
+
+
+def block_heavy_resources(page):
+    """Abort image/font/media and analytics requests for this page."""
+    def handle(route):
+        request = route.request
+        if (request.resource_type in BLOCKED_RESOURCE_TYPES
+                or any(host in request.url for host in BLOCKED_HOSTS)):
+            route.abort()
+        else:
+            route.continue_()
+
+    page.route("**/*", handle)
+
+# Minimum time between page loads on ficsit.app (politeness limit)
+MIN_NAVIGATION_INTERVAL = 0.5
+_last_navigation = 0.0
+
+
+def wait_for_navigation_slot():
+    """Sleep just long enough to keep page loads MIN_NAVIGATION_INTERVAL apart."""
+    global _last_navigation
+    wait = MIN_NAVIGATION_INTERVAL - (time.monotonic() - _last_navigation)
+    if wait > 0:
+        time.sleep(wait)
+    _last_navigation = time.monotonic()
+
+
+def tar_gz_command(archive, root, *members):
+    """tar command for a .tar.gz, using multi-threaded pigz when it is installed"""
+    if shutil.which("pigz"):
+        # Fastest level is plenty for a rolling pre-install backup
+        compress = ["-I", f"pigz -1 -p {os.cpu_count() or 1}"]
+    else:
+        compress = ["-z"]
+    return ["tar", *compress, "-cf", str(archive), "-C", str(root), *members]
+
 
 def create_backup(paths, logger):
     """Create backup before mod installation"""
@@ -42,8 +103,8 @@ def create_backup(paths, logger):
 
     try:
         subprocess.run(
-            ["tar", "-czf", str(backup_path), "-C", str(paths.project),
-             "data/saved", "data/gamefiles/FactoryGame/Mods"],
+            tar_gz_command(backup_path, paths.project,
+                           "data/saved", "data/gamefiles/FactoryGame/Mods"),
             check=True, capture_output=True
         )
         size = get_file_size(backup_path)
@@ -53,7 +114,7 @@ def create_backup(paths, logger):
     except subprocess.CalledProcessError:
         try:
             subprocess.run(
-                ["tar", "-czf", str(backup_path), "-C", str(paths.project), "data/saved"],
+                tar_gz_command(backup_path, paths.project, "data/saved"),
                 check=True, capture_output=True
             )
             logger.info(f"Backup created (saves only): {backup_name}")
@@ -83,45 +144,43 @@ def download_mod_browser(page, mod_info, paths, logger):
 
     try:
         # Navigate to mod page
+        wait_for_navigation_slot()
         logger.info(f"Navigating to {mod_url}")
-        page.goto(mod_url, wait_until="networkidle", timeout=30000)
+        page.goto(mod_url, wait_until="domcontentloaded", timeout=30000)
 
-        # Wait for page to fully load (JavaScript rendering)
-        time.sleep(2)
+        # Wait for the client-side render to produce a download button,
+        # rather than for the whole network to go idle
+        try:
+            page.locator(", ".join(DOWNLOAD_BUTTON_SELECTORS)).first.wait_for(timeout=10000)
+        except PlaywrightTimeout:
+            logger.info("No download button rendered yet, trying fallbacks")
 
         # Try to find download button
         download_button = None
 
-        selectors = [
-            'button:has-text("download")',
-            'button[aria-label*="download" i]',
-            'a:has-text("download")',
-            'button.download',
-            '[data-testid*="download"]',
-            'button:has(svg)',
-        ]
-
-        for selector in selectors:
+        for selector in DOWNLOAD_BUTTON_SELECTORS:
             try:
-                download_button = page.locator(selector).first
-                if download_button.is_visible(timeout=2000):
+                candidate = page.locator(selector).first
+                if candidate.is_visible(timeout=2000):
+                    download_button = candidate
                     logger.info(f"Found download button with selector: {selector}")
                     break
             except Exception:
                 continue
 
-        # If no button found, try to find by text content
-        if not download_button or not download_button.is_visible():
-            all_buttons = page.locator('button, a').all()
-            for btn in all_buttons:
-                try:
-                    text = btn.inner_text().lower()
-                    if 'download' in text or 'install' in text:
-                        download_button = btn
-                        logger.info(f"Found download button by text: {text}")
-                        break
-                except Exception:
-                    continue
+        # If no button found, try to find by text content. The filter runs
+        # in the browser, so this is one round-trip instead of one per element.
+        if not download_button:
+            candidate = page.locator("button, a").filter(has_text=DOWNLOAD_TEXT_PATTERN).first
+            if candidate.count():
+                download_button = candidate
+                logger.info("Found download button by text")
+
+        if not download_button:
+            candidate = page.locator(ICON_BUTTON_SELECTOR).first
+            if candidate.count() and candidate.is_visible():
+                download_button = candidate
+                logger.info(f"Falling back to icon button: {ICON_BUTTON_SELECTOR}")
 
         if not download_button:
             logger.error(f"Could not find download button for {mod_name}")
@@ -206,6 +265,7 @@ def main():
             viewport={'width': 1920, 'height': 1080}
         )
         page = context.new_page()
+        block_heavy_resources(page)
 
         try:
             for priority in [1, 2, 3, 4]:
@@ -222,9 +282,6 @@ def main():
                     else:
                         failed += 1
 
-                    # Small delay between downloads
-                    time.sleep(2)
-
         finally:
             browser.close()
 
@@ -4,16 +4,30 @@ Satisfactory Mod Installer
 Downloads and installs mods from ficsit.app for Linux dedicated servers.
 """
 
+import argparse
+import errno
 import json
 import os
 import sys
 import zipfile
 import shutil
+import struct
 import hashlib
-import urllib.request
-import urllib.error
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Dict, List, Any
+from typing import BinaryIO, Optional, Dict, List, Any, Union
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ImportError:
+    print("[ERROR] 'requests' library not found")
+    print("Install with: pip3 install requests")
+    sys.exit(1)
 
 # Configuration
 SCRIPT_DIR = Path(__file__).parent.absolute()
@@ -23,9 +37,40 @@ PROJECT_ROOT = SCRIPT_DIR.parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 MODS_DIR = DATA_DIR / "gamefiles" / "FactoryGame" / "Mods"
 TEMP_DIR = DATA_DIR / "temp_downloads"
+# Mod info from the API is kept here per mod and reused for API_CACHE_TTL
+# seconds, so repeated runs skip the GraphQL query (--refresh bypasses it)
+API_CACHE_DIR = DATA_DIR / "api_cache"
+API_CACHE_TTL = 600
+# Written into each mod folder after a successful install; lets later runs
+# skip mods that are already at the latest version
+INSTALL_MANIFEST = ".installed.json"
+# Downloaded archives stay in memory up to this size, then spill to TEMP_DIR
+SMOD_SPOOL_MAX_SIZE = 64 * 1024 * 1024
 
 API_URL = "https://api.ficsit.app"
 GRAPHQL_ENDPOINT = f"{API_URL}/v2/query"
+DOWNLOAD_WORKERS = 8  # Mods fetched and installed at once
+
+# Mods install on worker threads; each worker collects its mod's lines in
+# _output.lines and writes them as one block, so mods don't interleave
+_print_lock = threading.Lock()
+_output = threading.local()
+
+# One keep-alive session for every API query and download, pooled so each
+# install worker reuses its connection. The GraphQL POSTs are read-only
+# queries, so they are retried like GETs.
+SESSION = requests.Session()
+SESSION.headers["User-Agent"] = "SatisfactoryModInstaller/1.0"
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=None
+    )
+))
 
 # Colors for terminal output
 class Colors:
@@ -36,130 +81,329 @@ class Colors:
     RESET = "\033[0m"
     BOLD = "\033[1m"
 
+def _print(line: str):
+    lines = getattr(_output, "lines", None)
+    if lines is not None:
+        lines.append(line)
+        return
+    with _print_lock:
+        print(line, flush=True)
+
 def print_info(msg: str):
-    print(f"{Colors.BLUE}[INFO]{Colors.RESET} {msg}")
+    _print(f"{Colors.BLUE}[INFO]{Colors.RESET} {msg}")
 
 def print_success(msg: str):
-    print(f"{Colors.GREEN}[OK]{Colors.RESET} {msg}")
+    _print(f"{Colors.GREEN}[OK]{Colors.RESET} {msg}")
 
 def print_warn(msg: str):
-    print(f"{Colors.YELLOW}[WARN]{Colors.RESET} {msg}")
+    _print(f"{Colors.YELLOW}[WARN]{Colors.RESET} {msg}")
 
 def print_error(msg: str):
-    print(f"{Colors.RED}[ERROR]{Colors.RESET} {msg}")
+    _print(f"{Colors.RED}[ERROR]{Colors.RESET} {msg}")
 
-def graphql_query(query: str) -> Optional[Dict]:
+def graphql_query(query: str, variables: Optional[Dict[str, Any]] = None) -> Optional[Dict]:
     """Execute a GraphQL query against the ficsit.app API."""
-    data = json.dumps({"query": query}).encode("utf-8")
-    req = urllib.request.Request(
-        GRAPHQL_ENDPOINT,
-        data=data,
-        headers={"Content-Type": "application/json"}
-    )
+    payload: Dict[str, Any] = {"query": query}
+    if variables:
+        payload["variables"] = variables
     try:
-        with urllib.request.urlopen(req, timeout=30) as response:
-            result = json.loads(response.read().decode("utf-8"))
-            if "errors" in result and result["errors"]:
-                print_error(f"GraphQL error: {result['errors']}")
-                return None
-            return result.get("data")
-    except urllib.error.URLError as e:
+        response = SESSION.post(GRAPHQL_ENDPOINT, json=payload, timeout=30)
+        response.raise_for_status()
+        result = response.json()
+        if "errors" in result and result["errors"]:
+            print_error(f"GraphQL error: {result['errors']}")
+            return None
+        return result.get("data")
+    except (requests.RequestException, ValueError) as e:
         print_error(f"API request failed: {e}")
         return None
 
-def get_mod_info(mod_reference: str) -> Optional[Dict]:
-    """Get mod information including latest version and download links."""
-    query = f'''
-    query {{
-        getModByReference(modReference: "{mod_reference}") {{
+# Fields requested for each mod: latest version and its download targets
+MOD_INFO_FIELDS = '''
             id
             name
             mod_reference
-            versions(filter: {{limit: 1, order_by: created_at, order: desc}}) {{
+            versions(filter: {limit: 1, order_by: created_at, order: desc}) {
                 id
                 version
-                targets {{
+                targets {
                     targetName
                     link
-                }}
-            }}
-        }}
+                }
+            }
+'''
+
+# Built once; the mod reference is passed as a variable, never spliced in
+MOD_INFO_QUERY = f'''
+    query GetMod($modReference: ModReference!) {{
+        getModByReference(modReference: $modReference) {{{MOD_INFO_FIELDS}}}
     }}
-    '''
-    data = graphql_query(query)
+'''
+
+def get_mod_info(mod_reference: str) -> Optional[Dict]:
+    """Get mod information including latest version and download links."""
+    data = graphql_query(MOD_INFO_QUERY, {"modReference": mod_reference})
     if data and data.get("getModByReference"):
         return data["getModByReference"]
     return None
 
-def download_file(url: str, dest: Path) -> bool:
-    """Download a file from URL to destination."""
+def _read_api_cache(mod_reference: str) -> Optional[Dict]:
+    """Cached API info for a mod, or None if missing or older than API_CACHE_TTL."""
+    path = API_CACHE_DIR / f"{mod_reference}.json"
+    try:
+        if time.time() - path.stat().st_mtime < API_CACHE_TTL:
+            return json.loads(path.read_text())
+    except (OSError, ValueError):
+        pass
+    return None
+
+def _write_api_cache(mod_reference: str, info: Dict):
+    """Store API info for a mod; failures only cost a refetch next run."""
+    try:
+        API_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        (API_CACHE_DIR / f"{mod_reference}.json").write_text(json.dumps(info))
+    except OSError:
+        pass
+
+def get_mods_info_batch(mod_references: List[str], refresh: bool = False) -> Dict[str, Dict]:
+    """Get info for several mods in one aliased query, keyed by mod reference.
+
+    Fresh entries from API_CACHE_DIR are used unless refresh is set; only
+    the rest are queried. Mods the API doesn't know are left out, as are
+    all uncached mods if the query fails, so callers can fall back to
+    get_mod_info.
+    """
+    result: Dict[str, Dict] = {}
+    if not refresh:
+        for ref in mod_references:
+            cached = _read_api_cache(ref)
+            if cached:
+                result[ref] = cached
+    missing = [ref for ref in mod_references if ref not in result]
+    if not missing:
+        return result
+
+    params = ", ".join(f"$r{i}: ModReference!" for i in range(len(missing)))
+    fields = "\n".join(
+        f"m{i}: getModByReference(modReference: $r{i}) {{{MOD_INFO_FIELDS}}}"
+        for i in range(len(missing))
+    )
+    data = graphql_query(
+        f"query GetMods({params}) {{\n{fields}\n}}",
+        {f"r{i}": ref for i, ref in enumerate(missing)}
+    )
+    if not data:
+        return result
+    for i, ref in enumerate(missing):
+        info = data.get(f"m{i}")
+        if info:
+            result[ref] = info
+            _write_api_cache(ref, info)
+    return result
+
+def _preallocate(f: BinaryIO, size: int):
+    """Reserve size bytes for a new file in one go where the OS supports it."""
+    if size > 0 and hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+        except OSError:
+            pass
+
+def download_file(url: str, dest: Union[Path, BinaryIO]) -> bool:
+    """Download a file from URL to a destination path or open binary file."""
     try:
-        # Follow redirects
-        req = urllib.request.Request(url, headers={"User-Agent": "SatisfactoryModInstaller/1.0"})
-        with urllib.request.urlopen(req, timeout=60) as response:
-            with open(dest, "wb") as f:
-                shutil.copyfileobj(response, f)
+        # Redirects are followed by the session
+        with SESSION.get(url, stream=True, timeout=60) as response:
+            response.raise_for_status()
+            chunks = response.iter_content(chunk_size=1024 * 1024)
+            if isinstance(dest, Path):
+                with open(dest, "wb") as f:
+                    for chunk in chunks:
+                        f.write(chunk)
+            else:
+                for chunk in chunks:
+                    dest.write(chunk)
         return True
     except Exception as e:
         print_error(f"Download failed: {e}")
         return False
 
-def get_file_hash(filepath: Path) -> str:
-    """Calculate MD5 hash of a file."""
-    md5 = hashlib.md5()
-    with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            md5.update(chunk)
-    return md5.hexdigest()
+def _hash_stream(f: BinaryIO) -> str:
+    """SHA-256 of a binary stream, read in 1 MiB blocks into one reused buffer."""
+    sha256 = hashlib.sha256()
+    if not hasattr(f, "readinto"):
+        # SpooledTemporaryFile only has readinto on Python 3.11+
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            sha256.update(chunk)
+        return sha256.hexdigest()
+    buf = memoryview(bytearray(1024 * 1024))
+    while True:
+        n = f.readinto(buf)
+        if not n:
+            break
+        sha256.update(buf[:n])
+    return sha256.hexdigest()
+
+def get_file_hash(file: Union[Path, BinaryIO]) -> str:
+    """Calculate SHA-256 hash of a file path or an open binary file (read from its current position)."""
+    if isinstance(file, Path):
+        with open(file, "rb", buffering=0) as f:
+            return _hash_stream(f)
+    return _hash_stream(file)
+
+# Archive folders installed with the mod; anything else in the .smod is skipped
+SMOD_INSTALL_DIRS = {"Content", "Binaries", "Config", "Resources"}
+# Server pak files that are also placed in the mod root
+LINUX_PAKS_PREFIX = "Content/Paks/LinuxServer/"
+PAK_EXTENSIONS = (".pak", ".ucas", ".utoc")
+
+def _archive_fd(archive: Any) -> Optional[int]:
+    """File descriptor of an on-disk archive for in-kernel copies, or None."""
+    if not hasattr(os, "copy_file_range"):
+        return None
+    if isinstance(archive, tempfile.SpooledTemporaryFile):
+        # fileno() would push an in-memory buffer to disk; only use it once
+        # the download has already spilled over
+        size = archive.seek(0, os.SEEK_END)
+        archive.seek(0)
+        if size <= SMOD_SPOOL_MAX_SIZE:
+            return None
+    try:
+        return archive.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+def _copy_stored_member(src_fd: int, info: zipfile.ZipInfo, dest: str) -> bool:
+    """Copy an uncompressed entry with copy_file_range. Returns False if it can't."""
+    # Entry data follows a 30 byte local header plus its name and extra field
+    header = os.pread(src_fd, 30, info.header_offset)
+    if len(header) < 30 or header[:4] != b"PK\x03\x04":
+        return False
+    name_len, extra_len = struct.unpack("<HH", header[26:30])
+    offset = info.header_offset + 30 + name_len + extra_len
+
+    with open(dest, "wb") as dst:
+        _preallocate(dst, info.file_size)
+        remaining = info.file_size
+        while remaining:
+            n = os.copy_file_range(src_fd, dst.fileno(), remaining, offset)
+            if n == 0:
+                return False
+            offset += n
+            remaining -= n
+    return True
 
-def extract_smod(smod_path: Path, mod_reference: str) -> bool:
-    """Extract .smod file and install mod files with FULL directory structure."""
+def _extract_member(zf: zipfile.ZipFile, info: zipfile.ZipInfo, dest: str,
+                    src_fd: Optional[int] = None):
+    """Stream one archive entry to dest (its folder must exist).
+
+    Stored (uncompressed) entries, such as the large pak files, are copied
+    by the kernel when src_fd is the archive's file descriptor.
+    """
+    if (src_fd is not None and info.compress_type == zipfile.ZIP_STORED
+            and not info.flag_bits & 0x1):
+        try:
+            if _copy_stored_member(src_fd, info, dest):
+                return
+        except OSError:
+            pass
+    with zf.open(info) as src, open(dest, "wb") as dst:
+        _preallocate(dst, info.file_size)
+        shutil.copyfileobj(src, dst, length=1024 * 1024)
+
+def _link_or_copy(src: str, dest: str):
+    """Hardlink src to dest, copying instead where links aren't supported."""
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copy2(src, dest)
+
+def _swap_into_place(staging: str, mod_dest: Path):
+    """Replace mod_dest with staging, keeping the old folder until the new one is in.
+
+    The old folder is parked in TEMP_DIR (outside Mods, so the engine never
+    loads it) and restored if the new one can't be moved in. A parked
+    folder left by a crash is handled by sweep_interrupted_installs.
+    """
+    old = TEMP_DIR / f"old_{mod_dest.name}"
+    if old.exists():
+        shutil.rmtree(old)
+    had_old = mod_dest.exists()
+    if had_old:
+        try:
+            os.replace(mod_dest, old)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            # TEMP_DIR is on another filesystem; park by copying
+            shutil.move(str(mod_dest), str(old))
     try:
-        # Create a temporary extraction directory
-        extract_dir = TEMP_DIR / f"extract_{mod_reference}"
-        if extract_dir.exists():
-            shutil.rmtree(extract_dir)
-        extract_dir.mkdir(parents=True)
-
-        # Extract the smod (zip) file
-        with zipfile.ZipFile(smod_path, 'r') as zf:
-            zf.extractall(extract_dir)
-
-        # Remove old mod directory if exists
-        mod_dest = MODS_DIR / mod_reference
+        try:
+            os.replace(staging, mod_dest)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            # TEMP_DIR is on another filesystem; fall back to copying
+            shutil.move(staging, str(mod_dest))
+    except Exception:
         if mod_dest.exists():
-            shutil.rmtree(mod_dest)
-
-        # Copy ENTIRE mod structure, not just pak files
-        # First, copy the root level files (.uplugin, .smm, etc.)
+            shutil.rmtree(mod_dest, ignore_errors=True)
+        if had_old:
+            shutil.move(str(old), str(mod_dest))
+        raise
+    if had_old:
+        shutil.rmtree(old, ignore_errors=True)
+
+def extract_smod(smod: Union[Path, BinaryIO], mod_reference: str) -> bool:
+    """Extract .smod file (path or seekable file) and install mod files with FULL directory structure."""
+    mod_dest = MODS_DIR / mod_reference
+    # Extract next to the Mods folder (same filesystem) and swap the result
+    # in, so a failed extract leaves the previous install untouched
+    staging = TEMP_DIR / f"staging_{mod_reference}"
+    try:
+        if staging.exists():
+            shutil.rmtree(staging)
+
+        # Entries are streamed straight into the staging folder: root level
+        # files (.uplugin, .smm, etc.) and the Content, Binaries, Config and
+        # Resources trees. Nothing else is written to disk.
+        # Paths are plain strings here: the loop runs once per archive entry
+        root = str(staging)
+        made_dirs = set()
         files_copied = 0
-        for item in extract_dir.iterdir():
-            dest_path = mod_dest / item.name
-            if item.is_file():
-                mod_dest.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(item, dest_path)
+        linux_paks = []
+        with zipfile.ZipFile(smod, 'r') as zf:
+            src_fd = _archive_fd(zf.fp if isinstance(smod, Path) else smod)
+            for info in zf.infolist():
+                name = info.filename
+                if info.is_dir() or name.startswith("/") or ".." in name.split("/"):
+                    continue
+                top, sep, _ = name.partition("/")
+                if sep and top not in SMOD_INSTALL_DIRS:
+                    continue
+
+                dest = os.path.join(root, name)
+                parent = os.path.dirname(dest)
+                if parent not in made_dirs:
+                    os.makedirs(parent, exist_ok=True)
+                    made_dirs.add(parent)
+                _extract_member(zf, info, dest, src_fd)
+                files_copied += 1
+
+                rest = name[len(LINUX_PAKS_PREFIX):]
+                if (name.startswith(LINUX_PAKS_PREFIX) and "/" not in rest
+                        and rest.endswith(PAK_EXTENSIONS)):
+                    linux_paks.append(name)
+
+        # Also place pak files from Content/Paks/LinuxServer/ in mod root
+        for name in linux_paks:
+            dest_file = os.path.join(root, name.rpartition("/")[2])
+            if not os.path.exists(dest_file):  # Don't overwrite if already copied
+                _link_or_copy(os.path.join(root, name), dest_file)
                 files_copied += 1
-            elif item.is_dir():
-                # Copy directories (Content, Binaries, Config, Resources, etc.)
-                if item.name in ["Content", "Binaries", "Config", "Resources"]:
-                    shutil.copytree(item, dest_path)
-                    files_copied += sum(1 for _ in dest_path.rglob("*") if _.is_file())
-
-        # Also copy pak files from Content/Paks/LinuxServer/ to mod root
-        paks_dir = extract_dir / "Content" / "Paks" / "LinuxServer"
-        if paks_dir.exists():
-            mod_dest.mkdir(parents=True, exist_ok=True)
-            for ext in ["*.pak", "*.ucas", "*.utoc"]:
-                for file in paks_dir.glob(ext):
-                    dest_file = mod_dest / file.name
-                    if not dest_file.exists():  # Don't overwrite if already copied
-                        shutil.copy2(file, dest_file)
-                        files_copied += 1
-
-        # Cleanup
-        shutil.rmtree(extract_dir)
 
         if files_copied > 0:
+            _swap_into_place(root, mod_dest)
             print_success(f"Installed {files_copied} files for {mod_reference}")
             return True
         else:
@@ -169,16 +413,33 @@ def extract_smod(smod_path: Path, mod_reference: str) -> bool:
     except Exception as e:
         print_error(f"Extraction failed for {mod_reference}: {e}")
         return False
+    finally:
+        if staging.exists():
+            shutil.rmtree(staging, ignore_errors=True)
 
-def install_mod(mod_info: Dict) -> bool:
-    """Download and install a single mod."""
+def read_install_manifest(mod_reference: str) -> Dict:
+    """Return the install manifest of an installed mod, or {} if there is none."""
+    try:
+        with open(MODS_DIR / mod_reference / INSTALL_MANIFEST, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def install_mod(mod_info: Dict, api_info: Optional[Dict] = None, force: bool = False) -> bool:
+    """Download and install a single mod.
+
+    api_info is the mod's API entry if already fetched (see
+    get_mods_info_batch); otherwise it is looked up here. Mods whose
+    manifest already records the latest version are skipped unless force.
+    """
     mod_reference = mod_info["mod_reference"]
     name = mod_info["name"]
 
     print_info(f"Processing: {name} ({mod_reference})")
 
     # Get mod details from API
-    api_info = get_mod_info(mod_reference)
+    if api_info is None:
+        api_info = get_mod_info(mod_reference)
     if not api_info:
         print_error(f"Could not find mod: {mod_reference}")
         return False
@@ -192,9 +453,13 @@ def install_mod(mod_info: Dict) -> bool:
     version_id = version["id"]
     version_num = version["version"]
 
+    if not force and read_install_manifest(mod_reference).get("version") == version_num:
+        print_info(f"{name} already at v{version_num}")
+        return True
+
     # Find Linux server download link
-    targets = version.get("targets", [])
-    linux_target = next((t for t in targets if t["targetName"] == "LinuxServer"), None)
+    targets = {t["targetName"]: t for t in version.get("targets", [])}
+    linux_target = targets.get("LinuxServer")
 
     if not linux_target:
         print_warn(f"No Linux server version for: {mod_reference}")
@@ -204,32 +469,81 @@ def install_mod(mod_info: Dict) -> bool:
     if not download_link.startswith("http"):
         download_link = f"{API_URL}{download_link}"
 
-    # Create temp directory
+    # Create temp directory (large archives spill over into it)
     TEMP_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Download the smod file
-    smod_path = TEMP_DIR / f"{mod_reference}-{version_num}.smod"
+    # Download the smod file into a spooled buffer and read it from there;
+    # it is deleted when closed
+    with tempfile.SpooledTemporaryFile(max_size=SMOD_SPOOL_MAX_SIZE, dir=TEMP_DIR) as smod:
+        print_info(f"Downloading {mod_reference} v{version_num}...")
+        if not download_file(download_link, smod):
+            return False
 
-    print_info(f"Downloading v{version_num}...")
-    if not download_file(download_link, smod_path):
-        return False
+        # Verify it's a valid zip file
+        smod.seek(0)
+        if not zipfile.is_zipfile(smod):
+            print_error(f"Downloaded file is not a valid archive: {mod_reference}")
+            return False
 
-    # Verify it's a valid zip file
-    if not zipfile.is_zipfile(smod_path):
-        print_error(f"Downloaded file is not a valid archive: {mod_reference}")
-        smod_path.unlink()
-        return False
+        smod.seek(0)
+        digest = get_file_hash(smod)
 
-    # Extract and install
-    if not extract_smod(smod_path, mod_reference):
-        return False
+        # Extract and install
+        smod.seek(0)
+        if not extract_smod(smod, mod_reference):
+            return False
 
-    # Cleanup smod file
-    smod_path.unlink()
+    manifest = {"version": version_num, "id": version_id, "sha256": digest}
+    (MODS_DIR / mod_reference / INSTALL_MANIFEST).write_text(json.dumps(manifest))
 
     print_success(f"Installed: {name} v{version_num}")
     return True
 
+def install_mod_buffered(mod_info: Dict, api_info: Optional[Dict] = None, force: bool = False) -> bool:
+    """Run install_mod with its output held back and printed as one block."""
+    _output.lines = []
+    try:
+        return install_mod(mod_info, api_info, force)
+    finally:
+        lines, _output.lines = _output.lines, None
+        if lines:
+            with _print_lock:
+                # Blank line between mods
+                sys.stdout.write("\n".join(lines) + "\n\n")
+                sys.stdout.flush()
+
+def sweep_interrupted_installs():
+    """Clean up after installs that were interrupted mid-swap.
+
+    A parked old_<mod> folder is moved back if its mod folder is missing
+    (the crash hit between the two renames), otherwise deleted. Leftover
+    staging folders are deleted, as are .<mod>.old folders that older
+    versions of this script parked inside Mods.
+    """
+    if TEMP_DIR.exists():
+        with os.scandir(TEMP_DIR) as entries:
+            leftovers = [e for e in entries if e.is_dir(follow_symlinks=False)]
+        for entry in leftovers:
+            if entry.name.startswith("old_"):
+                mod_dest = MODS_DIR / entry.name[len("old_"):]
+                if not mod_dest.exists():
+                    print_warn(f"Restoring {mod_dest.name} from an interrupted install")
+                    shutil.move(entry.path, str(mod_dest))
+                    continue
+            elif not entry.name.startswith("staging_"):
+                continue
+            shutil.rmtree(entry.path, ignore_errors=True)
+
+    if MODS_DIR.exists():
+        with os.scandir(MODS_DIR) as entries:
+            parked = [
+                e.path for e in entries
+                if e.name.startswith(".") and e.name.endswith(".old")
+                and e.is_dir(follow_symlinks=False)
+            ]
+        for path in parked:
+            shutil.rmtree(path, ignore_errors=True)
+
 def cleanup_old_mods():
     """Remove old/incorrect mod files."""
     if not MODS_DIR.exists():
@@ -237,13 +551,19 @@ def cleanup_old_mods():
 
     print_info("Cleaning up old mod files...")
 
-    # Remove any .pak files directly in Mods directory (old format)
-    for pak_file in MODS_DIR.glob("*.pak"):
-        file_size = pak_file.stat().st_size
+    # Remove any .pak files directly in Mods directory (old format). scandir
+    # filters by name before stat, and mod folders are never stat'ed.
+    with os.scandir(MODS_DIR) as entries:
+        pak_files = [
+            e for e in entries
+            if e.name.endswith(".pak") and e.is_file(follow_symlinks=False)
+        ]
+    for pak_file in pak_files:
+        file_size = pak_file.stat(follow_symlinks=False).st_size
         # The incorrect files were all 95MB (99456192 bytes)
         if file_size == 99456192:
             print_warn(f"Removing incorrect file: {pak_file.name}")
-            pak_file.unlink()
+            os.unlink(pak_file.path)
         else:
             # Check if it's a valid pak (should have "FPakEntry" or similar markers)
             # For safety, just warn about unknown files
@@ -260,59 +580,77 @@ def load_mods_list() -> List[Dict]:
 
     return data.get("mods", [])
 
+def parse_args() -> argparse.Namespace:
+    """Parse command line options. With no category option, all mods are installed."""
+    parser = argparse.ArgumentParser(description="Install Satisfactory server mods from ficsit.app")
+    category = parser.add_mutually_exclusive_group()
+    category.add_argument("--qol-only", "--qol", dest="category", action="store_const",
+                          const="quality-of-life", help="Install only Quality of Life mods")
+    category.add_argument("--content-only", "--content", dest="category", action="store_const",
+                          const="content", help="Install only Content mods")
+    category.add_argument("--cheat-only", "--cheat", dest="category", action="store_const",
+                          const="cheat", help="Install only Cheat mods")
+    parser.add_argument("--force", action="store_true",
+                        help="Reinstall mods that are already up to date")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Ignore cached mod info and query ficsit.app")
+    parser.add_argument("--jobs", "-j", type=int, default=DOWNLOAD_WORKERS,
+                        help=f"Mods to install at once (default: {DOWNLOAD_WORKERS})")
+    args = parser.parse_args()
+    args.jobs = max(1, args.jobs)
+    return args
+
 def main():
     """Main entry point."""
     print(f"\n{Colors.BOLD}=== Satisfactory Mod Installer ==={Colors.RESET}\n")
 
-    # Parse arguments
-    category_filter = None
-    if len(sys.argv) > 1:
-        arg = sys.argv[1].lower()
-        if arg in ["--qol", "--qol-only"]:
-            category_filter = "quality-of-life"
-        elif arg in ["--content", "--content-only"]:
-            category_filter = "content"
-        elif arg in ["--cheat", "--cheat-only"]:
-            category_filter = "cheat"
-        elif arg in ["--help", "-h"]:
-            print("Usage: install.py [OPTIONS]")
-            print("Options:")
-            print("  --qol-only      Install only Quality of Life mods")
-            print("  --content-only  Install only Content mods")
-            print("  --cheat-only    Install only Cheat mods")
-            print("  (no option)     Install all mods")
-            sys.exit(0)
+    args = parse_args()
+    category_filter = args.category
 
     # Create necessary directories
     MODS_DIR.mkdir(parents=True, exist_ok=True)
     TEMP_DIR.mkdir(parents=True, exist_ok=True)
 
     # Cleanup old files
+    sweep_interrupted_installs()
     cleanup_old_mods()
 
     # Load mods list
     mods = load_mods_list()
 
+    # Sort by priority (sets submission order; installs overlap)
+    mods.sort(key=lambda x: x.get("priority", 99))
+
     # Filter by category if specified
     if category_filter:
         mods = [m for m in mods if m.get("category") == category_filter]
         print_info(f"Installing {category_filter} mods only")
 
-    # Sort by priority
-    mods.sort(key=lambda x: x.get("priority", 99))
-
     print_info(f"Found {len(mods)} mods to install\n")
 
-    # Install each mod
+    # One request for every mod's version info instead of one per mod
+    api_infos = get_mods_info_batch([m["mod_reference"] for m in mods], refresh=args.refresh)
+
+    # Install mods concurrently; each is network bound and writes only to
+    # its own temp files and Mods/<mod_reference> folder
     success_count = 0
     fail_count = 0
 
-    for mod in mods:
-        if install_mod(mod):
-            success_count += 1
-        else:
-            fail_count += 1
-        print()  # Empty line between mods
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        futures = {
+            pool.submit(install_mod_buffered, mod, api_infos.get(mod["mod_reference"]), args.force): mod
+            for mod in mods
+        }
+        for future in as_completed(futures):
+            try:
+                ok = future.result()
+            except Exception as e:
+                print_error(f"Install failed for {futures[future]['mod_reference']}: {e}")
+                ok = False
+            if ok:
+                success_count += 1
+            else:
+                fail_count += 1
 
     # Summary
     print(f"\n{Colors.BOLD}=== Installation Complete ==={Colors.RESET}")
@@ -322,10 +660,11 @@ def main():
 
     # List installed mods
     if MODS_DIR.exists():
-        installed = [d.name for d in MODS_DIR.iterdir() if d.is_dir()]
+        with os.scandir(MODS_DIR) as entries:
+            installed = sorted(e.name for e in entries if e.is_dir(follow_symlinks=False))
         if installed:
             print(f"\n{Colors.BOLD}Installed mods:{Colors.RESET}")
-            for mod_name in sorted(installed):
+            for mod_name in installed:
                 print(f"  - {mod_name}")
 
     print(f"\n{Colors.YELLOW}Remember to restart the server:{Colors.RESET}")
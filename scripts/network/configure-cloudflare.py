@@ -47,12 +47,18 @@ class CloudflareZeroTrustConfig:
             "Authorization": f"Bearer {api_token}",
             "Content-Type": "application/json"
         }
+        # Reuse one connection for every API call
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
 
-    def get_tunnels(self) -> Optional[list]:
-        """Get list of tunnels"""
+    def get_tunnels(self, name: Optional[str] = None) -> Optional[list]:
+        """Get list of active tunnels, optionally only those with the given name"""
         url = f"{ZERO_TRUST_API_BASE}/accounts/{self.account_id}/cfd_tunnel"
+        params = {"is_deleted": "false", "per_page": 50}
+        if name:
+            params["name"] = name
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
             return response.json().get("result", [])
         except requests.exceptions.RequestException as e:
@@ -60,8 +66,8 @@ class CloudflareZeroTrustConfig:
             return None
 
     def find_tunnel(self, tunnel_name: str) -> Optional[Dict[str, Any]]:
-        """Find tunnel by name"""
-        tunnels = self.get_tunnels()
+        """Find tunnel by name (filtered by the API, so only matches are fetched)"""
+        tunnels = self.get_tunnels(name=tunnel_name)
         if not tunnels:
             return None
 
@@ -74,7 +80,7 @@ class CloudflareZeroTrustConfig:
         """Get tunnel configuration"""
         url = f"{ZERO_TRUST_API_BASE}/accounts/{self.account_id}/cfd_tunnel/{tunnel_id}/configurations"
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self.session.get(url, timeout=10)
             response.raise_for_status()
             return response.json().get("result", {})
         except requests.exceptions.RequestException as e:
@@ -45,6 +45,11 @@ install_mods() {
         return 1
     fi
 
+    if ! python3 -c "import requests" 2>/dev/null; then
+        log_error "Python 'requests' library is required (pip3 install requests)"
+        return 1
+    fi
+
     cd "$PROJECT_DIR"
     if python3 "$MOD_INSTALL_SCRIPT"; then
         log_success "Mods installed successfully"